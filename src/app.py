@@ -43,6 +43,12 @@ class MSR605XApplication(Adw.Application):
         self.add_action(preferences_action)
         self.set_accels_for_action("app.preferences", ["<primary>comma"])
 
+        # Primary menu for the actions above, shared by every window
+        self.main_menu = Gio.Menu()
+        self.main_menu.append("Preferences", "app.preferences")
+        self.main_menu.append("About", "app.about")
+        self.main_menu.append("Quit", "app.quit")
+
     def do_activate(self):
         """Handle application activation."""
         if not self.window:
@@ -137,6 +143,14 @@ class MSR605XApplication(Adw.Application):
             min-height: 48px;
             font-size: 14px;
         }
+
+        .panel-padded-24 {
+            margin: 24px;
+        }
+
+        .panel-padded-12 {
+            margin: 12px;
+        }
         """
 
     def _on_quit(self, action, param):
@@ -3,17 +3,70 @@
 from typing import Optional
 from dataclasses import dataclass
 from enum import Enum
+import re
+import time
 
 from .device import MSR605XDevice
 from .constants import (
     Command, Coercivity, TrackNumber, BPI, BPC, DataFormat,
-    ErrorCode, ERROR_MESSAGES, ESC, FS, STATUS_OK, STATUS_ERROR,
-    HID_TIMEOUT_MS
+    ErrorCode, ESC, FS, STATUS_OK, STATUS_ERROR,
+    HID_TIMEOUT_MS, error_message
 )
 from .parser import TrackParser, TrackData
 
-
-@dataclass
+# Command bytes bound once so call sites skip the enum attribute lookups
+_CMD_RESET = Command.RESET.value
+_CMD_TEST_COMM = Command.TEST_COMM.value
+_CMD_TEST_RAM = Command.TEST_RAM.value
+_CMD_TEST_SENSOR = Command.TEST_SENSOR.value
+_CMD_GET_FIRMWARE = Command.GET_FIRMWARE.value
+_CMD_LED_ALL_OFF = Command.LED_ALL_OFF.value
+_CMD_LED_ALL_ON = Command.LED_ALL_ON.value
+_CMD_LED_GREEN_ON = Command.LED_GREEN_ON.value
+_CMD_LED_YELLOW_ON = Command.LED_YELLOW_ON.value
+_CMD_LED_RED_ON = Command.LED_RED_ON.value
+_CMD_READ_ISO = Command.READ_ISO.value
+_CMD_READ_RAW = Command.READ_RAW.value
+_CMD_WRITE_ISO = Command.WRITE_ISO.value
+_CMD_WRITE_RAW = Command.WRITE_RAW.value
+_CMD_ERASE_CARD = Command.ERASE_CARD.value
+_CMD_SET_HICO = Command.SET_HICO.value
+_CMD_SET_LOCO = Command.SET_LOCO.value
+_CMD_GET_COERCIVITY = Command.GET_COERCIVITY.value
+_CMD_SET_BPI = Command.SET_BPI.value
+_CMD_SET_BPC = Command.SET_BPC.value
+_CMD_SET_LEADING_ZERO = Command.SET_LEADING_ZERO.value
+
+# Coercivity commands are just ESC x (Hi-Co) or ESC y (Lo-Co), no data bytes
+_COERCIVITY_COMMANDS = {
+    Coercivity.HIGH: _CMD_SET_HICO,
+    Coercivity.LOW: _CMD_SET_LOCO,
+}
+
+# First 0x00 (Lo-Co) or 0x01 (Hi-Co) byte in a coercivity response
+_COERCIVITY_BYTE = re.compile(b'[\x00\x01]')
+
+_LED_COMMANDS = {
+    "all": _CMD_LED_ALL_ON,
+    "green": _CMD_LED_GREEN_ON,
+    "yellow": _CMD_LED_YELLOW_ON,
+    "red": _CMD_LED_RED_ON,
+}
+
+# Erase track selection bytes indexed by binary mask
+# 0x01 = Track 1, 0x02 = Track 2, 0x04 = Track 3, 0x07 = All
+_ERASE_MASKS = tuple(bytes([mask]) for mask in range(8))
+
+# BPI/BPC payloads for every track/setting pair
+# BPI encoded as: 0 for 75, 1 for 210
+_SET_BPI_DATA = {
+    (track, bpi): bytes([track, 1 if bpi == BPI.BPI_210 else 0])
+    for track in TrackNumber for bpi in BPI
+}
+_SET_BPC_DATA = {(track, bpc): bytes([track, bpc]) for track in TrackNumber for bpc in BPC}
+
+
+@dataclass(slots=True, frozen=True)
 class CommandResult:
     """Result of a command execution."""
     success: bool
@@ -35,7 +88,11 @@ class MSR605XCommands:
         self._device = device
         self._parser = TrackParser()
         self._coercivity = Coercivity.HIGH
+        self._coercivity_cmd = _COERCIVITY_COMMANDS[Coercivity.HIGH]
+        self._coercivity_on_device: Optional[Coercivity] = None
         self._data_format = DataFormat.ISO
+        self._firmware_cache: Optional[CommandResult] = None
+        self._firmware_version: Optional[str] = None
 
     @property
     def device(self) -> MSR605XDevice:
@@ -47,54 +104,81 @@ class MSR605XCommands:
         """Check if device is connected."""
         return self._device.is_connected
 
+    @property
+    def firmware_version(self) -> Optional[str]:
+        """Get the firmware version decoded by get_firmware_version, if any."""
+        return self._firmware_version
+
     def _parse_status(self, response: bytes) -> tuple[bool, ErrorCode]:
         """Parse response status byte.
 
-        Simple check: success if ESC '0' is in response.
+        Success if the response carries ESC '0', the ESC 's' data marker,
+        or is at least two bytes long. Both markers are two bytes, so the
+        length check alone classifies the response without scanning it.
         Based on working MSR605X implementation.
         """
         if not response:
             return False, ErrorCode.COMMUNICATION_ERROR
 
-        # Simple success check (matches working implementation)
-        if b'\x1b0' in response or b'\x1b\x30' in response:
-            return True, ErrorCode.SUCCESS
-
-        # If we have track data (ESC s marker), assume success
-        # Read operations may not have explicit status byte
-        if b'\x1bs' in response or b'\x1b\x73' in response:
-            return True, ErrorCode.SUCCESS
-
-        # If response has reasonable length, assume success
-        # (write/erase might return short response without explicit status)
+        # ESC '0' (status OK) and ESC 's' (track data, read operations may
+        # not have explicit status byte) both imply len >= 2, and
+        # write/erase might return a short response without explicit status
         if len(response) >= 2:
             return True, ErrorCode.SUCCESS
 
         return False, ErrorCode.UNKNOWN_ERROR
 
+    def _ensure_coercivity(self) -> None:
+        """Send the coercivity setting unless the device already has it.
+
+        Waits the full second for the ACK, a late one left after the flush
+        would be taken as the status of the write that follows.
+        """
+        if self._coercivity_on_device == self._coercivity:
+            return
+
+        device = self._device
+        success, _ = device.send_and_receive(self._coercivity_cmd, timeout_ms=1000)
+        device.flush()
+        self._coercivity_on_device = self._coercivity if success else None
+
     # === Device Control Commands ===
 
-    def reset(self) -> CommandResult:
+    def reset(self, settle_ms: int = 300) -> CommandResult:
         """
         Reset the device to initial state.
         Cancels any pending operation and turns off LEDs.
 
+        Args:
+            settle_ms: Maximum time in milliseconds to wait for the device
+                to settle. The wait ends early once the device goes quiet.
+
         Returns:
             CommandResult with operation status.
         """
-        import time
+        device = self._device
 
         # Flush any pending data first
-        self._device.flush()
+        device.flush()
 
         # Send reset command (ESC a) - doesn't return a response
-        success, _ = self._device.send_command(Command.RESET.value)
+        success, _ = device.send_command(_CMD_RESET)
 
-        # Wait for device to reset
-        time.sleep(0.3)
+        # Wait for device to reset, stop once two polls in a row come back empty
+        deadline = time.monotonic() + settle_ms / 1000
+        idle_polls = 0
+        while idle_polls < 2 and time.monotonic() < deadline:
+            received, _ = device.receive_response(20)
+            idle_polls = 0 if received else idle_polls + 1
 
         # Flush again to clear any residual data
-        self._device.flush()
+        device.flush()
+
+        # Device state is fresh, re-query firmware and re-send
+        # coercivity on next request
+        self._firmware_cache = None
+        self._firmware_version = None
+        self._coercivity_on_device = None
 
         return CommandResult(
             success=success,
@@ -102,6 +186,15 @@ class MSR605XCommands:
             message="Device reset" if success else "Reset failed"
         )
 
+    def cancel(self) -> None:
+        """
+        Cancel an operation waiting for a card swipe.
+
+        The interrupted read, write or erase returns as if no card was
+        swiped. Call reset() afterwards to return the device to idle.
+        """
+        self._device.cancel_receive()
+
     def test_communication(self) -> CommandResult:
         """
         Test communication with device.
@@ -109,13 +202,13 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
-        success, response = self._device.send_and_receive(Command.TEST_COMM.value)
+        _, response = self._device.send_and_receive(_CMD_TEST_COMM)
         ok, error_code = self._parse_status(response)
 
         return CommandResult(
-            success=success and ok,
+            success=ok,
             error_code=error_code,
-            message="Communication OK" if ok else ERROR_MESSAGES.get(error_code, "Communication failed")
+            message="Communication OK" if ok else error_message(error_code, "Communication failed")
         )
 
     def test_ram(self) -> CommandResult:
@@ -125,11 +218,11 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
-        success, response = self._device.send_and_receive(Command.TEST_RAM.value)
+        _, response = self._device.send_and_receive(_CMD_TEST_RAM)
         ok, error_code = self._parse_status(response)
 
         return CommandResult(
-            success=success and ok,
+            success=ok,
             error_code=error_code,
             message="RAM test passed" if ok else "RAM test failed"
         )
@@ -141,11 +234,11 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
-        success, response = self._device.send_and_receive(Command.TEST_SENSOR.value)
+        _, response = self._device.send_and_receive(_CMD_TEST_SENSOR)
         ok, error_code = self._parse_status(response)
 
         return CommandResult(
-            success=success and ok,
+            success=ok,
             error_code=error_code,
             message="Sensor test passed" if ok else "Sensor test failed"
         )
@@ -154,20 +247,27 @@ class MSR605XCommands:
         """
         Get device firmware version.
 
+        The result is cached after the first successful query since
+        firmware does not change while the device is powered.
+
         Returns:
             CommandResult with firmware version in message.
         """
-        success, response = self._device.send_and_receive(Command.GET_FIRMWARE.value)
+        if self._firmware_cache is not None:
+            return self._firmware_cache
+
+        success, response = self._device.send_and_receive(_CMD_GET_FIRMWARE)
 
         if success and response:
             # Extract version string
-            version = response.decode('ascii', errors='ignore').strip('\x00\x1b')
-            return CommandResult(
+            self._firmware_version = response.decode('ascii', errors='ignore').strip('\x00\x1b')
+            self._firmware_cache = CommandResult(
                 success=True,
                 error_code=ErrorCode.SUCCESS,
-                message=f"Firmware: {version}",
+                message=f"Firmware: {self._firmware_version}",
                 data=response
             )
+            return self._firmware_cache
 
         return CommandResult(
             success=False,
@@ -179,7 +279,7 @@ class MSR605XCommands:
 
     def led_off(self) -> CommandResult:
         """Turn off all LEDs."""
-        success, _ = self._device.send_command(Command.LED_ALL_OFF.value)
+        success, _ = self._device.send_command(_CMD_LED_ALL_OFF)
         return CommandResult(
             success=success,
             error_code=ErrorCode.SUCCESS if success else ErrorCode.COMMUNICATION_ERROR,
@@ -196,15 +296,8 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
-        commands = {
-            "all": Command.LED_ALL_ON,
-            "green": Command.LED_GREEN_ON,
-            "yellow": Command.LED_YELLOW_ON,
-            "red": Command.LED_RED_ON,
-        }
-
-        cmd = commands.get(color.lower(), Command.LED_ALL_ON)
-        success, _ = self._device.send_command(cmd.value)
+        cmd = _LED_COMMANDS.get(color.lower(), _CMD_LED_ALL_ON)
+        success, _ = self._device.send_command(cmd)
 
         return CommandResult(
             success=success,
@@ -225,7 +318,7 @@ class MSR605XCommands:
             CommandResult with parsed track data.
         """
         # Send read command
-        success, _ = self._device.send_command(Command.READ_ISO.value)
+        success, _ = self._device.send_command(_CMD_READ_ISO)
         if not success:
             return CommandResult(
                 success=False,
@@ -233,6 +326,18 @@ class MSR605XCommands:
                 message="Failed to send read command"
             )
 
+        return self._receive_iso(timeout_ms)
+
+    def _receive_iso(self, timeout_ms: int) -> CommandResult:
+        """
+        Receive and parse the response to an ISO read command.
+
+        Args:
+            timeout_ms: Timeout in milliseconds to wait for card swipe.
+
+        Returns:
+            CommandResult with parsed track data.
+        """
         # Wait for card swipe and response
         success, response = self._device.receive_response(timeout_ms)
 
@@ -249,7 +354,7 @@ class MSR605XCommands:
             return CommandResult(
                 success=False,
                 error_code=error_code,
-                message=ERROR_MESSAGES.get(error_code, "Read failed")
+                message=error_message(error_code, "Read failed")
             )
 
         tracks = self._parser.parse_iso_response(response)
@@ -272,7 +377,9 @@ class MSR605XCommands:
         Returns:
             CommandResult with raw track data.
         """
-        success, _ = self._device.send_command(Command.READ_RAW.value)
+        device = self._device
+
+        success, _ = device.send_command(_CMD_READ_RAW)
         if not success:
             return CommandResult(
                 success=False,
@@ -280,7 +387,7 @@ class MSR605XCommands:
                 message="Failed to send read command"
             )
 
-        success, response = self._device.receive_response(timeout_ms)
+        success, response = device.receive_response(timeout_ms)
 
         if not success or not response:
             return CommandResult(
@@ -294,7 +401,7 @@ class MSR605XCommands:
             return CommandResult(
                 success=False,
                 error_code=error_code,
-                message=ERROR_MESSAGES.get(error_code, "Read failed")
+                message=error_message(error_code, "Read failed")
             )
 
         tracks = self._parser.parse_raw_response(response)
@@ -331,23 +438,19 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
+        device = self._device
+
         # Flush any pending data
-        self._device.flush()
+        device.flush()
 
         # Set coercivity before writing (required by MSR605X)
-        # Command is just ESC x (Hi-Co) or ESC y (Lo-Co), no data bytes
-        if self._coercivity == Coercivity.HIGH:
-            self._device.send_command(Command.SET_HICO.value)
-        else:
-            self._device.send_command(Command.SET_LOCO.value)
-        self._device.receive_response(1000)  # Wait for ACK
-        self._device.flush()
+        self._ensure_coercivity()
 
         # Build data payload (without sentinels - device adds them)
         data = self._parser.build_iso_write_data(track1, track2, track3)
 
         # Send write command with data
-        success, _ = self._device.send_command(Command.WRITE_ISO.value, data)
+        success, _ = device.send_command(_CMD_WRITE_ISO, data)
         if not success:
             return CommandResult(
                 success=False,
@@ -356,7 +459,7 @@ class MSR605XCommands:
             )
 
         # Wait for card swipe and response
-        success, response = self._device.receive_response(timeout_ms)
+        success, response = device.receive_response(timeout_ms)
 
         if not success:
             return CommandResult(
@@ -370,7 +473,7 @@ class MSR605XCommands:
         return CommandResult(
             success=ok,
             error_code=error_code,
-            message="Card written successfully" if ok else ERROR_MESSAGES.get(error_code, "Write failed")
+            message="Card written successfully" if ok else error_message(error_code, "Write failed")
         )
 
     def write_raw(
@@ -392,20 +495,17 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
+        device = self._device
+
         # Flush any pending data
-        self._device.flush()
+        device.flush()
 
         # Set coercivity before writing (required by MSR605X)
-        if self._coercivity == Coercivity.HIGH:
-            self._device.send_command(Command.SET_HICO.value)
-        else:
-            self._device.send_command(Command.SET_LOCO.value)
-        self._device.receive_response(1000)  # Wait for ACK
-        self._device.flush()
+        self._ensure_coercivity()
 
         data = self._parser.build_raw_write_data(track1, track2, track3)
 
-        success, _ = self._device.send_command(Command.WRITE_RAW.value, data)
+        success, _ = device.send_command(_CMD_WRITE_RAW, data)
         if not success:
             return CommandResult(
                 success=False,
@@ -413,7 +513,7 @@ class MSR605XCommands:
                 message="Failed to send write command"
             )
 
-        success, response = self._device.receive_response(timeout_ms)
+        success, response = device.receive_response(timeout_ms)
 
         if not success:
             return CommandResult(
@@ -427,7 +527,10 @@ class MSR605XCommands:
         return CommandResult(
             success=ok,
             error_code=error_code,
-            message="Card written successfully (raw)" if ok else ERROR_MESSAGES.get(error_code, "Write failed")
+            message=(
+                "Card written successfully (raw)" if ok
+                else error_message(error_code, "Write failed")
+            )
         )
 
     # === Erase Operations ===
@@ -451,30 +554,19 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
+        device = self._device
+
         # Flush any pending data
-        self._device.flush()
+        device.flush()
 
         # Set coercivity before erasing
-        if self._coercivity == Coercivity.HIGH:
-            self._device.send_command(Command.SET_HICO.value)
-        else:
-            self._device.send_command(Command.SET_LOCO.value)
-        self._device.receive_response(1000)
-        self._device.flush()
-
-        # Build track selection byte (binary mask)
-        # 0x01 = Track 1, 0x02 = Track 2, 0x04 = Track 3, 0x07 = All
-        mask = 0
-        if track1:
-            mask |= 0x01
-        if track2:
-            mask |= 0x02
-        if track3:
-            mask |= 0x04
-
-        data = bytes([mask])
-
-        success, _ = self._device.send_command(Command.ERASE_CARD.value, data)
+        self._ensure_coercivity()
+
+        # Track selection byte (binary mask)
+        mask = bool(track1) | bool(track2) << 1 | bool(track3) << 2
+        data = _ERASE_MASKS[mask]
+
+        success, _ = device.send_command(_CMD_ERASE_CARD, data)
         if not success:
             return CommandResult(
                 success=False,
@@ -482,7 +574,7 @@ class MSR605XCommands:
                 message="Failed to send erase command"
             )
 
-        success, response = self._device.receive_response(timeout_ms)
+        success, response = device.receive_response(timeout_ms)
 
         if not success:
             return CommandResult(
@@ -496,7 +588,7 @@ class MSR605XCommands:
         return CommandResult(
             success=ok,
             error_code=error_code,
-            message="Card erased successfully" if ok else ERROR_MESSAGES.get(error_code, "Erase failed")
+            message="Card erased successfully" if ok else error_message(error_code, "Erase failed")
         )
 
     # === Configuration ===
@@ -511,11 +603,7 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
-        # Coercivity commands are just ESC x (Hi-Co) or ESC y (Lo-Co), no data bytes
-        if coercivity == Coercivity.HIGH:
-            cmd = Command.SET_HICO.value
-        else:
-            cmd = Command.SET_LOCO.value
+        cmd = _COERCIVITY_COMMANDS[coercivity]
 
         success, response = self._device.send_and_receive(cmd)
 
@@ -523,6 +611,8 @@ class MSR605XCommands:
 
         if ok:
             self._coercivity = coercivity
+            self._coercivity_cmd = cmd
+            self._coercivity_on_device = coercivity
 
         co_name = "Hi-Co" if coercivity == Coercivity.HIGH else "Lo-Co"
 
@@ -539,21 +629,22 @@ class MSR605XCommands:
         Returns:
             CommandResult with coercivity in message.
         """
-        success, response = self._device.send_and_receive(Command.GET_COERCIVITY.value)
+        success, response = self._device.send_and_receive(_CMD_GET_COERCIVITY)
 
-        if success and response:
-            # Parse coercivity from response
-            for byte in response:
-                if byte in (0, 1):
-                    co = Coercivity(byte)
-                    self._coercivity = co
-                    co_name = "Hi-Co" if co == Coercivity.HIGH else "Lo-Co"
-                    return CommandResult(
-                        success=True,
-                        error_code=ErrorCode.SUCCESS,
-                        message=f"Current coercivity: {co_name}",
-                        data=response
-                    )
+        # Parse coercivity from response
+        match = _COERCIVITY_BYTE.search(response) if success else None
+        if match:
+            co = Coercivity(match.group()[0])
+            self._coercivity = co
+            self._coercivity_cmd = _COERCIVITY_COMMANDS[co]
+            self._coercivity_on_device = co
+            co_name = "Hi-Co" if co == Coercivity.HIGH else "Lo-Co"
+            return CommandResult(
+                success=True,
+                error_code=ErrorCode.SUCCESS,
+                message=f"Current coercivity: {co_name}",
+                data=response
+            )
 
         return CommandResult(
             success=False,
@@ -572,11 +663,9 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
-        # BPI encoded as: 0 for 75, 1 for 210
-        bpi_value = 1 if bpi == BPI.BPI_210 else 0
-        data = bytes([track.value, bpi_value])
+        data = _SET_BPI_DATA[track, bpi]
 
-        success, response = self._device.send_and_receive(Command.SET_BPI.value, data)
+        success, response = self._device.send_and_receive(_CMD_SET_BPI, data)
         ok, error_code = self._parse_status(response)
 
         return CommandResult(
@@ -596,9 +685,9 @@ class MSR605XCommands:
         Returns:
             CommandResult with operation status.
         """
-        data = bytes([track.value, bpc.value])
+        data = _SET_BPC_DATA[track, bpc]
 
-        success, response = self._device.send_and_receive(Command.SET_BPC.value, data)
+        success, response = self._device.send_and_receive(_CMD_SET_BPC, data)
         ok, error_code = self._parse_status(response)
 
         return CommandResult(
@@ -620,7 +709,7 @@ class MSR605XCommands:
         """
         data = bytes([track.value, min(zeros, 255)])
 
-        success, response = self._device.send_and_receive(Command.SET_LEADING_ZERO.value, data)
+        success, response = self._device.send_and_receive(_CMD_SET_LEADING_ZERO, data)
         ok, error_code = self._parse_status(response)
 
         return CommandResult(
@@ -684,20 +773,13 @@ class MSR605XCommands:
         """Normalize track data by adding sentinels if missing."""
         if not data:
             return data
-        if track_num == 1:
-            # Track 1: % ... ?
-            if not data.startswith('%'):
-                data = '%' + data
-            if not data.endswith('?'):
-                data = data + '?'
-            return data.upper()
-        else:
-            # Track 2, 3: ; ... ?
-            if not data.startswith(';'):
-                data = ';' + data
-            if not data.endswith('?'):
-                data = data + '?'
-            return data
+        # Track 1: % ... ?  Track 2, 3: ; ... ?
+        start = '%' if track_num == 1 else ';'
+        if data[0] != start:
+            data = start + data
+        if data[-1] != '?':
+            data += '?'
+        return data.upper() if track_num == 1 else data
 
     def compare_card(
         self,
@@ -719,7 +801,54 @@ class MSR605XCommands:
             CommandResult indicating match/mismatch.
         """
         # Read the card
-        read_result = self.read_iso(timeout_ms)
+        return self._compare_tracks(self.read_iso(timeout_ms), track1, track2, track3)
+
+    def start_compare(self) -> bool:
+        """
+        Start a compare without waiting for the card swipe.
+
+        Poll response_pending() and call finish_compare() once a
+        response has arrived or the caller's timeout has passed.
+
+        Returns:
+            True if the read command was sent.
+        """
+        success, _ = self._device.send_command(_CMD_READ_ISO)
+        return success
+
+    def response_pending(self) -> bool:
+        """Check without blocking whether the device has sent a response."""
+        return self._device.has_response()
+
+    def finish_compare(
+        self,
+        track1: Optional[str] = None,
+        track2: Optional[str] = None,
+        track3: Optional[str] = None,
+        timeout_ms: int = 0
+    ) -> CommandResult:
+        """
+        Finish a compare started with start_compare().
+
+        Args:
+            track1: Expected track 1 data
+            track2: Expected track 2 data
+            track3: Expected track 3 data
+            timeout_ms: Time to wait for the rest of the response
+
+        Returns:
+            CommandResult indicating match/mismatch.
+        """
+        return self._compare_tracks(self._receive_iso(timeout_ms), track1, track2, track3)
+
+    def _compare_tracks(
+        self,
+        read_result: CommandResult,
+        track1: Optional[str],
+        track2: Optional[str],
+        track3: Optional[str]
+    ) -> CommandResult:
+        """Compare the tracks of a read result with expected data."""
         if not read_result.success or not read_result.tracks:
             return CommandResult(
                 success=False,
@@ -728,16 +857,14 @@ class MSR605XCommands:
             )
 
         # Compare tracks (normalize expected data to include sentinels)
+        expected_tracks = {
+            num: self._normalize_track_data(data, num)
+            for num, data in ((1, track1), (2, track2), (3, track3))
+            if data
+        }
         mismatches = []
         for track in read_result.tracks:
-            expected = None
-            if track.track_number == 1:
-                expected = self._normalize_track_data(track1, 1) if track1 else None
-            elif track.track_number == 2:
-                expected = self._normalize_track_data(track2, 2) if track2 else None
-            elif track.track_number == 3:
-                expected = self._normalize_track_data(track3, 3) if track3 else None
-
+            expected = expected_tracks.get(track.track_number)
             if expected is not None and track.data != expected:
                 mismatches.append(f"Track {track.track_number}")
 
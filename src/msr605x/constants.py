@@ -160,13 +160,24 @@ ERROR_MESSAGES = {
     ErrorCode.UNKNOWN_ERROR: "Unknown error occurred",
 }
 
+# Error messages indexed by error code value (None where a code has no message)
+_ERROR_MESSAGE_TABLE = tuple(ERROR_MESSAGES.get(code) for code in range(max(ErrorCode) + 1))
 
-# Track data delimiters for parsing
-TRACK_START_MARKERS = {
-    1: b'\x1b\x01',  # ESC + track number
-    2: b'\x1b\x02',
-    3: b'\x1b\x03',
-}
+
+def error_message(code: int, default: str = ERROR_MESSAGES[ErrorCode.UNKNOWN_ERROR]) -> str:
+    """Get the message for an error code, or default if it has none."""
+    if 0 <= code < len(_ERROR_MESSAGE_TABLE):
+        return _ERROR_MESSAGE_TABLE[code] or default
+    return default
+
+
+# Track data delimiters for parsing, indexed directly by track number
+TRACK_START_MARKERS = (
+    None,
+    b'\x1b\x01',  # ESC + track number
+    b'\x1b\x02',
+    b'\x1b\x03',
+)
 
 TRACK_END_MARKER = b'\x1c'  # FS (Field Separator)
 
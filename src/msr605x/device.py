@@ -1,9 +1,10 @@
 """MSR605X USB HID device communication handler."""
 
 import hid
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator
 from dataclasses import dataclass
-from threading import Lock
+from threading import Event, Lock, Thread
+import queue
 import time
 
 from .constants import (
@@ -12,7 +13,7 @@ from .constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfo:
     """MSR605X device information."""
     vendor_id: int
@@ -29,11 +30,21 @@ class MSR605XDevice:
 
     This class handles the raw USB HID communication including
     connection management, sending commands, and receiving responses.
+
+    While connected, a background reader thread drains incoming HID
+    reports into a queue so receiving never contends with sending.
     """
 
+    # Read timeout of the reader thread, bounds how long disconnect waits for it
+    READER_POLL_MS = 50
+
     def __init__(self):
         self._device: Optional[hid.device] = None
         self._lock = Lock()
+        self._tx_lock = Lock()
+        self._rx_queue: queue.Queue[bytes] = queue.Queue()
+        self._reader: Optional[Thread] = None
+        self._reader_stop = Event()
         self._connected = False
         self._device_info: Optional[DeviceInfo] = None
         self._on_status_change: Optional[Callable[[bool], None]] = None
@@ -58,24 +69,37 @@ class MSR605XDevice:
             self._on_status_change(connected)
 
     @staticmethod
-    def enumerate_devices() -> list[DeviceInfo]:
+    def iter_devices() -> Iterator[DeviceInfo]:
         """
-        Enumerate all connected MSR605X devices.
+        Iterate over connected MSR605X devices.
 
-        Returns:
-            List of DeviceInfo objects for each found device.
+        Yields:
+            DeviceInfo for each found device, built only as it is consumed.
         """
-        devices = []
         for dev in hid.enumerate(VENDOR_ID, PRODUCT_ID):
-            devices.append(DeviceInfo(
+            yield DeviceInfo(
                 vendor_id=dev['vendor_id'],
                 product_id=dev['product_id'],
                 serial_number=dev.get('serial_number', ''),
                 manufacturer=dev.get('manufacturer_string', 'Unknown'),
                 product=dev.get('product_string', 'MSR605X'),
                 path=dev['path']
-            ))
-        return devices
+            )
+
+    @staticmethod
+    def enumerate_devices() -> list[DeviceInfo]:
+        """
+        Enumerate all connected MSR605X devices.
+
+        Returns:
+            List of DeviceInfo objects for each found device.
+        """
+        return list(MSR605XDevice.iter_devices())
+
+    @staticmethod
+    def first_device() -> Optional[DeviceInfo]:
+        """Get the first connected MSR605X device, or None if there is none."""
+        return next(MSR605XDevice.iter_devices(), None)
 
     def connect(self, path: Optional[bytes] = None) -> tuple[bool, str]:
         """
@@ -91,6 +115,11 @@ class MSR605XDevice:
             if self._connected:
                 return False, "Already connected"
 
+            # Release a handle left behind by a reader that hit a read error
+            if self._device is not None:
+                self._stop_reader()
+                self._close_handle()
+
             try:
                 self._device = hid.device()
 
@@ -102,19 +131,48 @@ class MSR605XDevice:
                 self._device.set_nonblocking(False)
                 self._connected = True
 
-                # Get device info
-                devices = self.enumerate_devices()
-                if devices:
-                    self._device_info = devices[0]
+                # Get device strings from the open handle, the path comes from
+                # enumeration when the device was opened by VID/PID
+                if not path:
+                    found = self.first_device()
+                    path = found.path if found else b''
+                device = self._device
+                self._device_info = DeviceInfo(
+                    vendor_id=VENDOR_ID,
+                    product_id=PRODUCT_ID,
+                    serial_number=self._read_string(device.get_serial_number_string, ''),
+                    manufacturer=self._read_string(device.get_manufacturer_string, 'Unknown'),
+                    product=self._read_string(device.get_product_string, 'MSR605X'),
+                    path=path
+                )
+
+                self._start_reader()
 
                 self._notify_status_change(True)
                 return True, "Connected successfully"
 
             except Exception as e:
-                self._device = None
+                self._close_handle()
                 self._connected = False
                 return False, f"Connection failed: {str(e)}"
 
+    def _close_handle(self) -> None:
+        """Close and drop the device handle, ignoring errors from a dead device."""
+        if self._device is not None:
+            try:
+                self._device.close()
+            except Exception:
+                pass
+        self._device = None
+
+    @staticmethod
+    def _read_string(getter: Callable[[], Optional[str]], default: str) -> str:
+        """Read a string descriptor, falling back to default if it is missing."""
+        try:
+            return getter() or default
+        except Exception:
+            return default
+
     def disconnect(self) -> tuple[bool, str]:
         """
         Disconnect from MSR605X device.
@@ -127,6 +185,7 @@ class MSR605XDevice:
                 return False, "Not connected"
 
             try:
+                self._stop_reader()
                 self._device.close()
                 self._device = None
                 self._connected = False
@@ -137,6 +196,36 @@ class MSR605XDevice:
             except Exception as e:
                 return False, f"Disconnect failed: {str(e)}"
 
+    def _start_reader(self) -> None:
+        """Start the background thread feeding the receive queue."""
+        self._rx_queue = queue.Queue()
+        self._reader_stop.clear()
+        self._reader = Thread(target=self._reader_loop, args=(self._device,), daemon=True)
+        self._reader.start()
+
+    def _stop_reader(self) -> None:
+        """Stop the reader thread before the device handle is closed."""
+        self._reader_stop.set()
+        if self._reader is not None:
+            self._reader.join(timeout=1.0)
+            self._reader = None
+
+    def _reader_loop(self, device: hid.device) -> None:
+        """Read HID reports and push them onto the receive queue."""
+        while not self._reader_stop.is_set():
+            try:
+                data = device.read(HID_REPORT_SIZE, timeout_ms=self.READER_POLL_MS)
+            except Exception as e:
+                # The handle is unusable, report the device as gone and wake
+                # any receive waiting on the queue
+                print(f"Receive error: {e}")
+                self._connected = False
+                self._rx_queue.put(b'')
+                self._notify_status_change(False)
+                return
+            if data:
+                self._rx_queue.put(bytes(data))
+
     def _build_packets(self, data: bytes) -> list[bytes]:
         """
         Build HID packets with MSR605X header format.
@@ -145,14 +234,20 @@ class MSR605XDevice:
         Supports multi-packet messages for data > 63 bytes.
         """
         MAX_PAYLOAD = 63
-        packets = []
+        total_len = len(data)
+
+        # Everything but write payloads fits one packet, both first and last
+        if 0 < total_len <= MAX_PAYLOAD:
+            packet = bytearray(1 + MAX_PAYLOAD)
+            packet[0] = 0xC0 | total_len
+            packet[1:1 + total_len] = data
+            return [bytes(packet)]
 
+        packets = []
         offset = 0
-        total_len = len(data)
 
         while offset < total_len:
-            chunk = data[offset:offset + MAX_PAYLOAD]
-            chunk_len = len(chunk)
+            chunk_len = min(MAX_PAYLOAD, total_len - offset)
 
             is_first = (offset == 0)
             is_last = (offset + chunk_len >= total_len)
@@ -163,8 +258,11 @@ class MSR605XDevice:
             if is_last:
                 header |= 0x40
 
-            packet = bytes([header]) + chunk + bytes(MAX_PAYLOAD - chunk_len)
-            packets.append(packet)
+            # Zero padding is implicit in the preallocated buffer
+            packet = bytearray(1 + MAX_PAYLOAD)
+            packet[0] = header
+            packet[1:1 + chunk_len] = data[offset:offset + chunk_len]
+            packets.append(bytes(packet))
 
             offset += MAX_PAYLOAD
 
@@ -192,12 +290,12 @@ class MSR605XDevice:
         if not self.is_connected:
             return False, b''
 
-        with self._lock:
-            try:
-                # Build payload and packets with MSR605X header
-                payload = command + data
-                packets = self._build_packets(payload)
+        # Build payload and packets with MSR605X header
+        packets = self._build_packets(command + data)
 
+        # Lock only keeps the packets of one command contiguous
+        with self._tx_lock:
+            try:
                 # Send all packets
                 for packet in packets:
                     bytes_written = self._device.write(packet)
@@ -214,7 +312,8 @@ class MSR605XDevice:
         """
         Receive response from device.
 
-        Simple implementation matching working MSR605X driver.
+        Assembles packets queued by the reader thread until the last
+        packet flag is seen or the timeout expires.
 
         Args:
             timeout_ms: Timeout in milliseconds
@@ -225,29 +324,37 @@ class MSR605XDevice:
         if not self.is_connected:
             return False, b''
 
-        with self._lock:
+        response = bytearray()
+        deadline_ns = time.monotonic_ns() + timeout_ms * 1_000_000
+
+        while (remaining_ns := deadline_ns - time.monotonic_ns()) > 0:
             try:
-                response = b''
-                start_time = time.time()
+                data = self._rx_queue.get(timeout=remaining_ns / 1e9)
+            except queue.Empty:
+                break
 
-                while (time.time() - start_time) * 1000 < timeout_ms:
-                    # Read with 1 second chunks for responsiveness
-                    data = self._device.read(HID_REPORT_SIZE, timeout_ms=1000)
-                    if data:
-                        # Parse packet with MSR605X header format
-                        header = data[0]
-                        length = header & 0x3F
-                        response += bytes(data[1:1+length])
+            # Empty report is the cancel_receive marker
+            if not data:
+                break
 
-                        # Check for last packet flag
-                        if header & 0x40:
-                            break
+            # Parse packet with MSR605X header format
+            header = data[0]
+            length = header & 0x3F
+            response += memoryview(data)[1:1+length]
 
-                return len(response) > 0, response
+            # Check for last packet flag
+            if header & 0x40:
+                break
 
-            except Exception as e:
-                print(f"Receive error: {e}")
-                return False, b''
+        return len(response) > 0, bytes(response)
+
+    def has_response(self) -> bool:
+        """Check without blocking whether a report is waiting to be received."""
+        return not self._rx_queue.empty()
+
+    def cancel_receive(self) -> None:
+        """Make a pending receive_response return immediately without data."""
+        self._rx_queue.put(b'')
 
     def send_and_receive(
         self,
@@ -277,14 +384,9 @@ class MSR605XDevice:
         if not self.is_connected:
             return
 
-        with self._lock:
-            try:
-                # Set non-blocking mode for flush
-                self._device.set_nonblocking(True)
-                # Read and discard any pending data
-                while self._device.read(HID_REPORT_SIZE, timeout_ms=50):
-                    pass
-                # Restore blocking mode
-                self._device.set_nonblocking(False)
-            except Exception:
-                pass
+        # Discard any reports the reader thread has queued
+        try:
+            while True:
+                self._rx_queue.get_nowait()
+        except queue.Empty:
+            pass
@@ -10,7 +10,7 @@ from .constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackData:
     """Parsed track data."""
     track_number: int
@@ -29,9 +29,33 @@ class TrackParser:
     """
 
     # Character sets for validation
-    TRACK1_CHARSET = set(' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_')
-    TRACK2_CHARSET = set('0123456789:;<=>?')
-    TRACK3_CHARSET = set('0123456789:;<=>?')
+    TRACK1_CHARSET = frozenset(' !"#$%&\'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_')
+    TRACK2_CHARSET = frozenset('0123456789:;<=>?')
+    TRACK3_CHARSET = frozenset('0123456789:;<=>?')
+
+    # Characters accepted by ISO validation: all printable ASCII up to '_' for
+    # track 1 (for flexibility), the track charset plus sentinels for tracks 2 and 3
+    _TRACK1_VALID = re.compile(r'[\x20-\x5f]*')
+    _TRACK2_VALID = re.compile(r'[0-9:;<=>?%]*')
+    _TRACK3_VALID = _TRACK2_VALID
+
+    # Track marker (ESC + track number) and its data up to the next end marker
+    _TRACK_RE = re.compile(
+        rb'\x1b([\x01\x02\x03])(.*?)(?=\x1b[\x02\x03\x30\x31]|\?\x1c|\x1c|\Z)', re.DOTALL
+    )
+
+    # Control characters removed from decoded track data (tab is kept)
+    _CLEAN_TABLE = dict.fromkeys(c for c in range(32) if c != ord('\t'))
+
+    # AAMVA format varies by jurisdiction
+    # Basic parsing for common fields
+    _AAMVA_PATTERNS = (
+        ('iin', re.compile(r'^%([A-Z]{2})')),  # Issuer Identification Number (state)
+        ('license_number', re.compile(r'([A-Z0-9]+)\^')),
+        ('last_name', re.compile(r'\^([A-Z]+)\$')),
+        ('first_name', re.compile(r'\$([A-Z]+)\$')),
+        ('middle_name', re.compile(r'\$\$([A-Z]*)\^')),
+    )
 
     def __init__(self):
         self._data_format = DataFormat.ISO
@@ -50,16 +74,11 @@ class TrackParser:
         Returns:
             List of TrackData objects for each track.
         """
-        tracks = []
-
         # Response format: ESC s ESC 01 <track1> FS ESC 02 <track2> FS ESC 03 <track3> FS ? ESC status
-        # Find track markers
-        for track_num in [1, 2, 3]:
-            track_data = self._extract_track(response, track_num)
-            if track_data:
-                tracks.append(track_data)
-
-        return tracks
+        return [
+            self._build_track(track_num, raw_data)
+            for track_num, raw_data in self._split_tracks(response)
+        ]
 
     def parse_raw_response(self, response: bytes) -> list[TrackData]:
         """
@@ -71,89 +90,67 @@ class TrackParser:
         Returns:
             List of TrackData objects with raw binary data.
         """
-        tracks = []
-
-        for track_num in [1, 2, 3]:
-            track_data = self._extract_track(response, track_num, raw=True)
-            if track_data:
-                tracks.append(track_data)
+        return [
+            self._build_track(track_num, raw_data, raw=True)
+            for track_num, raw_data in self._split_tracks(response)
+        ]
 
-        return tracks
-
-    def _extract_track(self, response: bytes, track_num: int, raw: bool = False) -> Optional[TrackData]:
+    def _split_tracks(self, response: bytes) -> list[tuple[int, bytes]]:
         """
-        Extract data for a specific track from response.
+        Split response into track data in a single pass.
 
-        Response format: ESC s ESC 01 [t1] ESC 02 [t2] ESC 03 [t3] ? FS ESC [status]
+        Only the first marker of each track is used.
 
         Args:
             response: Full response bytes
+
+        Returns:
+            List of (track_number, raw_data) tuples ordered by track number.
+        """
+        found = {}
+        for match in self._TRACK_RE.finditer(response):
+            track_num = response[match.start(1)]
+            if track_num not in found:
+                # Only copy the data out for the occurrence that is kept
+                found[track_num] = match.group(2)
+        return sorted(found.items())
+
+    def _build_track(self, track_num: int, raw_data: bytes, raw: bool = False) -> TrackData:
+        """
+        Build TrackData from the bytes of a single track.
+
+        Args:
             track_num: Track number (1, 2, or 3)
+            raw_data: Track bytes between its start and end markers
             raw: Whether to treat as raw data
 
         Returns:
-            TrackData object or None if track not found.
+            TrackData object.
         """
-        # Track marker is ESC + track_num
-        start_marker = bytes([0x1b, track_num])
-
-        try:
-            start_idx = response.find(start_marker)
-            if start_idx == -1:
-                return None
-
-            # Data starts after ESC + track_num
-            data_start = start_idx + 2
-
-            # Find end of track data - look for the NEXT ESC byte
-            # which could be: ESC 02, ESC 03, ESC 0 (status), or ? FS
-            end_idx = len(response)
-
-            # Check for next track markers
-            for next_marker in [b'\x1b\x02', b'\x1b\x03', b'\x1b0', b'\x1b1', b'?\x1c', b'\x1c']:
-                pos = response.find(next_marker, data_start)
-                if pos != -1 and pos < end_idx:
-                    end_idx = pos
-
-            raw_data = response[data_start:end_idx]
-
-            if raw:
-                return TrackData(
-                    track_number=track_num,
-                    data=raw_data.hex(),
-                    raw_data=raw_data,
-                    is_valid=len(raw_data) > 0,
-                    format=DataFormat.RAW
-                )
-            else:
-                # Decode as ASCII
-                try:
-                    decoded = raw_data.decode('ascii', errors='replace')
-                    # Clean up any control characters except valid sentinels
-                    decoded = self._clean_track_data(decoded, track_num)
-
-                    is_valid = self._validate_track_data(decoded, track_num)
-
-                    return TrackData(
-                        track_number=track_num,
-                        data=decoded,
-                        raw_data=raw_data,
-                        is_valid=is_valid,
-                        format=self._data_format,
-                        error_message=None if is_valid else "Invalid characters in track data"
-                    )
-                except Exception as e:
-                    return TrackData(
-                        track_number=track_num,
-                        data="",
-                        raw_data=raw_data,
-                        is_valid=False,
-                        format=self._data_format,
-                        error_message=str(e)
-                    )
-
-        except Exception:
-            return None
+        if raw:
+            return TrackData(
+                track_number=track_num,
+                data=raw_data.hex(),
+                raw_data=raw_data,
+                is_valid=len(raw_data) > 0,
+                format=DataFormat.RAW
+            )
+
+        # Decode as ASCII (cannot fail with errors='replace')
+        decoded = raw_data.decode('ascii', errors='replace')
+        # Clean up any control characters except valid sentinels
+        decoded = self._clean_track_data(decoded, track_num)
+
+        is_valid = self._validate_track_data(decoded, track_num)
+
+        return TrackData(
+            track_number=track_num,
+            data=decoded,
+            raw_data=raw_data,
+            is_valid=is_valid,
+            format=self._data_format,
+            error_message=None if is_valid else "Invalid characters in track data"
+        )
 
     def _clean_track_data(self, data: str, track_num: int) -> str:
         """
@@ -166,13 +163,8 @@ class TrackParser:
         Returns:
             Cleaned string.
         """
-        # Remove null bytes and other control characters
-        cleaned = ''.join(c for c in data if ord(c) >= 32 or c in '\t')
-
-        # Remove any remaining escape sequences
-        cleaned = cleaned.replace('\x1b', '')
-
-        return cleaned.strip()
+        # Remove null bytes, escape sequences and other control characters
+        return data.translate(self._CLEAN_TABLE).strip()
 
     def _validate_track_data(self, data: str, track_num: int) -> bool:
         """
@@ -189,12 +181,12 @@ class TrackParser:
             return False
 
         specs = {
-            1: (TrackSpec.TRACK_1, self.TRACK1_CHARSET),
-            2: (TrackSpec.TRACK_2, self.TRACK2_CHARSET),
-            3: (TrackSpec.TRACK_3, self.TRACK3_CHARSET),
+            1: (TrackSpec.TRACK_1, self._TRACK1_VALID),
+            2: (TrackSpec.TRACK_2, self._TRACK2_VALID),
+            3: (TrackSpec.TRACK_3, self._TRACK3_VALID),
         }
 
-        spec, charset = specs.get(track_num, (None, None))
+        spec, pattern = specs.get(track_num, (None, None))
         if not spec:
             return False
 
@@ -203,14 +195,10 @@ class TrackParser:
             return False
 
         # For ISO format, validate characters
+        # Track 1 is uppercase alphanumeric, tracks 2 and 3 are numeric
+        # with some special chars
         if self._data_format == DataFormat.ISO:
-            # Track 1 is uppercase alphanumeric
-            if track_num == 1:
-                # Allow all printable ASCII for flexibility
-                return all(32 <= ord(c) <= 95 for c in data)
-            else:
-                # Tracks 2 and 3 are numeric with some special chars
-                return all(c in charset or c in '%?;' for c in data)
+            return pattern.fullmatch(data) is not None
 
         return True
 
@@ -237,43 +225,28 @@ class TrackParser:
         Returns:
             Bytes to send to device.
         """
-        data = b'\x1bs'  # Start of data block (ESC s)
+        parts = [b'\x1bs']  # Start of data block (ESC s)
 
         # Track 1 - NO sentinels, device adds them
-        data += b'\x1b\x01'
+        parts.append(TRACK_START_MARKERS[1])
         if track1:
             # Remove sentinels if user accidentally included them
-            t1 = track1.upper()
-            if t1.startswith('%'):
-                t1 = t1[1:]
-            if t1.endswith('?'):
-                t1 = t1[:-1]
-            data += t1.encode('ascii')
+            parts.append(track1.upper().removeprefix('%').removesuffix('?').encode('ascii'))
 
         # Track 2 - NO sentinels, device adds them
-        data += b'\x1b\x02'
+        parts.append(TRACK_START_MARKERS[2])
         if track2:
-            t2 = track2
-            if t2.startswith(';'):
-                t2 = t2[1:]
-            if t2.endswith('?'):
-                t2 = t2[:-1]
-            data += t2.encode('ascii')
+            parts.append(track2.removeprefix(';').removesuffix('?').encode('ascii'))
 
         # Track 3 - NO sentinels, device adds them
-        data += b'\x1b\x03'
+        parts.append(TRACK_START_MARKERS[3])
         if track3:
-            t3 = track3
-            if t3.startswith(';'):
-                t3 = t3[1:]
-            if t3.endswith('?'):
-                t3 = t3[:-1]
-            data += t3.encode('ascii')
+            parts.append(track3.removeprefix(';').removesuffix('?').encode('ascii'))
 
         # End with ? FS (required by MSR605X protocol)
-        data += b'?\x1c'
+        parts.append(b'?\x1c')
 
-        return data
+        return b''.join(parts)
 
     def build_raw_write_data(
         self,
@@ -295,33 +268,21 @@ class TrackParser:
         Returns:
             Bytes to send to device.
         """
-        data = b'\x1bs'  # Start of data block (ESC s)
-
-        # Track 1 with length byte
-        data += b'\x1b\x01'
-        if track1:
-            data += bytes([len(track1)]) + track1
-        else:
-            data += b'\x00'  # Zero length
-
-        # Track 2 with length byte
-        data += b'\x1b\x02'
-        if track2:
-            data += bytes([len(track2)]) + track2
-        else:
-            data += b'\x00'  # Zero length
-
-        # Track 3 with length byte
-        data += b'\x1b\x03'
-        if track3:
-            data += bytes([len(track3)]) + track3
-        else:
-            data += b'\x00'  # Zero length
+        parts = [b'\x1bs']  # Start of data block (ESC s)
+
+        # Each track marker is followed by a length byte (zero if empty) and data
+        for marker, track in zip(TRACK_START_MARKERS[1:], (track1, track2, track3)):
+            parts.append(marker)
+            if track:
+                parts.append(bytes([len(track)]))
+                parts.append(track)
+            else:
+                parts.append(b'\x00')  # Zero length
 
         # End with ? FS (required by MSR605X protocol)
-        data += b'?\x1c'
+        parts.append(b'?\x1c')
 
-        return data
+        return b''.join(parts)
 
     def parse_aamva(self, track_data: str) -> dict:
         """
@@ -335,18 +296,8 @@ class TrackParser:
         """
         result = {}
 
-        # AAMVA format varies by jurisdiction
-        # Basic parsing for common fields
-        patterns = {
-            'iin': r'^%([A-Z]{2})',  # Issuer Identification Number (state)
-            'license_number': r'([A-Z0-9]+)\^',
-            'last_name': r'\^([A-Z]+)\$',
-            'first_name': r'\$([A-Z]+)\$',
-            'middle_name': r'\$\$([A-Z]*)\^',
-        }
-
-        for field, pattern in patterns.items():
-            match = re.search(pattern, track_data)
+        for field, pattern in self._AAMVA_PATTERNS:
+            match = pattern.search(track_data)
             if match:
                 result[field] = match.group(1)
 
@@ -362,10 +313,12 @@ class TrackParser:
         Returns:
             Formatted string for display.
         """
-        lines = []
-        for track in tracks:
-            status = "OK" if track.is_valid else "ERROR"
-            lines.append(f"Track {track.track_number} [{status}]: {track.data}")
-            if track.error_message:
-                lines.append(f"  Error: {track.error_message}")
-        return '\n'.join(lines)
+        return '\n'.join(self._format_track(track) for track in tracks)
+
+    def _format_track(self, track: TrackData) -> str:
+        """Format a single track, with its error line if any."""
+        status = "OK" if track.is_valid else "ERROR"
+        line = f"Track {track.track_number} [{status}]: {track.data}"
+        if track.error_message:
+            return f"{line}\n  Error: {track.error_message}"
+        return line
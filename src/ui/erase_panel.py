@@ -7,9 +7,9 @@ gi.require_version('Adw', '1')
 
 from gi.repository import Gtk, Adw, GLib
 from typing import Callable
-from threading import Thread
 
 from ..msr605x.commands import MSR605XCommands
+from .io_pool import IO_POOL
 
 
 class ErasePanel(Gtk.Box):
@@ -25,10 +25,7 @@ class ErasePanel(Gtk.Box):
         self.commands = commands
         self.show_toast = show_toast
 
-        self.set_margin_top(24)
-        self.set_margin_bottom(24)
-        self.set_margin_start(24)
-        self.set_margin_end(24)
+        self.add_css_class("panel-padded-24")
 
         self._build_ui()
 
@@ -61,10 +58,7 @@ class ErasePanel(Gtk.Box):
         tracks_frame.set_margin_top(16)
 
         tracks_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        tracks_box.set_margin_top(12)
-        tracks_box.set_margin_bottom(12)
-        tracks_box.set_margin_start(12)
-        tracks_box.set_margin_end(12)
+        tracks_box.add_css_class("panel-padded-12")
 
         # All tracks option
         self.all_tracks_check = Gtk.CheckButton(label="All Tracks")
@@ -133,10 +127,7 @@ class ErasePanel(Gtk.Box):
         info_frame.set_label("Information")
 
         info_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        info_box.set_margin_top(12)
-        info_box.set_margin_bottom(12)
-        info_box.set_margin_start(12)
-        info_box.set_margin_end(12)
+        info_box.add_css_class("panel-padded-12")
 
         info_items = [
             "Track 1: Contains alphanumeric data (name, account info)",
@@ -237,8 +228,7 @@ class ErasePanel(Gtk.Box):
             result = self.commands.erase(track1, track2, track3, timeout_ms=15000)
             GLib.idle_add(self._on_erase_complete, result)
 
-        thread = Thread(target=do_erase, daemon=True)
-        thread.start()
+        IO_POOL.submit(do_erase)
 
     def _on_erase_complete(self, result):
         """Handle erase operation result."""
@@ -0,0 +1,7 @@
+"""Shared worker for device I/O."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Single worker for every command sent to the device, so commands from the
+# window and the panels run one at a time and never take each other's reports
+IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="msr605x-io")
@@ -5,14 +5,32 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib
+from gi.repository import Gtk, Adw, GLib, Gdk
 from typing import Callable, Optional
-from threading import Thread
+from threading import Lock, Thread
+from pathlib import Path
+import os
 
 from ..msr605x.commands import MSR605XCommands
 from ..msr605x.parser import TrackData
 from ..msr605x.constants import DataFormat
 from ..utils.file_io import FileManager
+from .io_pool import IO_POOL
+
+# Flat styling for software-rendered GTK, enabled with MSR605X_FAST_UI=1
+FAST_UI_CSS = """
+.fast-ui, .fast-ui * {
+    border-radius: 0;
+    box-shadow: none;
+    transition: none;
+}
+"""
+
+# Read format choices as (id, label), in drop-down order
+READ_FORMATS = (
+    ("iso", "ISO (Standard)"),
+    ("raw", "Raw Data"),
+)
 
 
 class ReadPanel(Gtk.Box):
@@ -30,16 +48,38 @@ class ReadPanel(Gtk.Box):
         self.show_toast = show_toast
         self.file_manager = file_manager
         self.current_tracks: list[TrackData] = []
-
-        self.set_margin_top(24)
-        self.set_margin_bottom(24)
-        self.set_margin_start(24)
-        self.set_margin_end(24)
+        # Data of the current tracks keyed by track number
+        self.current_tracks_by_number: dict[int, str] = {}
+        self._clipboard_text = ""
+        self._save_dialog: Optional[Gtk.FileChooserNative] = None
+        # Display clipboard, looked up once the panel is mapped
+        self._clipboard: Optional[Gdk.Clipboard] = None
+        # Validity style currently applied to each track entry (None = unstyled)
+        self._track_validity: list[Optional[bool]] = [None, None, None]
+
+        # Latest worker result waiting for the main loop, at most one idle
+        # callback is scheduled to deliver it
+        self._result_lock = Lock()
+        self._pending_result = None
+        self._idle_scheduled = False
+        # Bound main loop callbacks, looked up once rather than per idle_add
+        self._drain_result_cb = self._drain_result
+        self._save_complete_cb = self._on_save_complete
+
+        # Read in flight, and whether the user asked to cancel it
+        self._reading = False
+        self._cancelled = False
+
+        self.add_css_class("panel-padded-24")
 
         self._build_ui()
+        self.connect("map", self._on_map)
 
     def _build_ui(self):
         """Build the panel UI."""
+        if os.environ.get("MSR605X_FAST_UI") == "1":
+            self._apply_fast_ui_css()
+
         # Title
         title = Gtk.Label(label="Read Card")
         title.add_css_class("panel-title")
@@ -62,10 +102,8 @@ class ReadPanel(Gtk.Box):
         format_label = Gtk.Label(label="Read Format:")
         format_box.append(format_label)
 
-        self.format_combo = Gtk.ComboBoxText()
-        self.format_combo.append("iso", "ISO (Standard)")
-        self.format_combo.append("raw", "Raw Data")
-        self.format_combo.set_active_id("iso")
+        self.format_combo = Gtk.DropDown.new_from_strings([label for _, label in READ_FORMATS])
+        self.format_combo.set_selected(0)
         format_box.append(self.format_combo)
 
         self.append(format_box)
@@ -84,36 +122,25 @@ class ReadPanel(Gtk.Box):
         self.status_label.set_margin_top(8)
         self.append(self.status_label)
 
-        # Spinner for loading state
-        self.spinner = Gtk.Spinner()
-        self.spinner.set_visible(False)
-        self.append(self.spinner)
-
         # Track data display
         tracks_frame = Gtk.Frame()
         tracks_frame.set_label("Track Data")
         tracks_frame.set_margin_top(16)
 
         tracks_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        tracks_box.set_margin_top(12)
-        tracks_box.set_margin_bottom(12)
-        tracks_box.set_margin_start(12)
-        tracks_box.set_margin_end(12)
-
-        # Track 1
-        track1_box = self._create_track_display("Track 1", "alphanumeric")
-        self.track1_entry = track1_box.get_first_child().get_next_sibling()
-        tracks_box.append(track1_box)
-
-        # Track 2
-        track2_box = self._create_track_display("Track 2", "numeric")
-        self.track2_entry = track2_box.get_first_child().get_next_sibling()
-        tracks_box.append(track2_box)
-
-        # Track 3
-        track3_box = self._create_track_display("Track 3", "numeric")
-        self.track3_entry = track3_box.get_first_child().get_next_sibling()
-        tracks_box.append(track3_box)
+        tracks_box.add_css_class("panel-padded-12")
+
+        # Track entries, indexed by track number - 1
+        entries = []
+        for label, description in (
+            ("Track 1", "alphanumeric"),
+            ("Track 2", "numeric"),
+            ("Track 3", "numeric"),
+        ):
+            track_box, entry = self._create_track_display(label, description)
+            entries.append(entry)
+            tracks_box.append(track_box)
+        self.track_entries: tuple[Gtk.Entry, ...] = tuple(entries)
 
         tracks_frame.set_child(tracks_box)
         self.append(tracks_frame)
@@ -138,22 +165,31 @@ class ReadPanel(Gtk.Box):
 
         self.append(action_box)
 
-    def _create_track_display(self, label: str, description: str) -> Gtk.Box:
-        """Create a track data display widget."""
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
+    def _apply_fast_ui_css(self):
+        """Drop rounded corners, shadows and transitions from this panel."""
+        self.add_css_class("fast-ui")
 
-        # Label with description
-        label_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        track_label = Gtk.Label(label=label)
-        track_label.add_css_class("track-label")
-        track_label.set_xalign(0)
-        label_box.append(track_label)
+        css_provider = Gtk.CssProvider()
+        css_provider.load_from_data(FAST_UI_CSS.encode())
+        Gtk.StyleContext.add_provider_for_display(
+            Gdk.Display.get_default(),
+            css_provider,
+            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+        )
 
-        desc_label = Gtk.Label(label=f"({description})")
-        desc_label.add_css_class("dim-label")
-        label_box.append(desc_label)
+    def _create_track_display(self, label: str, description: str) -> tuple[Gtk.Box, Gtk.Entry]:
+        """Create a track data display widget and return it with its entry."""
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
 
-        box.append(label_box)
+        # Label with dimmed description, in a single markup label
+        header = Gtk.Label()
+        header.set_markup(
+            f"<b>{GLib.markup_escape_text(label)}</b> "
+            f"<span weight='normal' alpha='60%'>({GLib.markup_escape_text(description)})</span>"
+        )
+        header.add_css_class("track-label")
+        header.set_xalign(0)
+        box.append(header)
 
         # Entry for data
         entry = Gtk.Entry()
@@ -162,99 +198,127 @@ class ReadPanel(Gtk.Box):
         entry.set_placeholder_text("No data")
         box.append(entry)
 
-        return box
+        return box, entry
 
     def _on_read_clicked(self, button):
-        """Handle read button click."""
+        """Handle read button click, or cancel the read in progress."""
+        if self._reading:
+            self._cancelled = True
+            self.status_label.set_text("Cancelling...")
+            self.commands.cancel()
+            return
+
+        self._cancelled = False
         self._set_reading_state(True)
         self._clear_tracks()
         self.status_label.set_text("Waiting for card swipe...")
 
-        format_id = self.format_combo.get_active_id()
+        format_id = READ_FORMATS[self.format_combo.get_selected()][0]
+
+        read = self.commands.read_raw if format_id == "raw" else self.commands.read_iso
+        future = IO_POOL.submit(read, timeout_ms=15000)
+        future.add_done_callback(lambda f: self._post_result(f.result()))
 
-        def do_read():
-            if format_id == "raw":
-                result = self.commands.read_raw(timeout_ms=15000)
-            else:
-                result = self.commands.read_iso(timeout_ms=15000)
+    def _post_result(self, result):
+        """Pass a worker result to the main loop without flooding it."""
+        with self._result_lock:
+            self._pending_result = result
+            if self._idle_scheduled:
+                return
+            self._idle_scheduled = True
+        GLib.idle_add(self._drain_result_cb, priority=GLib.PRIORITY_DEFAULT_IDLE)
 
-            GLib.idle_add(self._on_read_complete, result)
+    def _drain_result(self):
+        """Deliver the latest pending result on the main loop."""
+        with self._result_lock:
+            result = self._pending_result
+            self._pending_result = None
+            self._idle_scheduled = False
 
-        thread = Thread(target=do_read, daemon=True)
-        thread.start()
+        self._on_read_complete(result)
+        return GLib.SOURCE_REMOVE
 
     def _on_read_complete(self, result):
         """Handle read operation result."""
+        status = self.status_label
+        toast = self.show_toast
         self._set_reading_state(False)
 
         # Reset device to idle state (turn off LEDs, cancel any pending operation)
         self.commands.reset()
 
-        if result.success and result.tracks:
-            self.current_tracks = result.tracks
-            self._display_tracks(result.tracks)
-            self.status_label.set_text("Card read successfully")
-            self.show_toast("Card read successfully", False)
+        if self._cancelled:
+            self._cancelled = False
+            self._set_text(status, "Read cancelled")
+        elif result.success and result.tracks:
+            tracks = result.tracks
+            self.current_tracks = tracks
+            self.current_tracks_by_number = {track.track_number: track.data for track in tracks}
+            self._clipboard_text = "\n".join(
+                f"Track {track.track_number}: {track.data}" for track in tracks
+            )
+            self._display_tracks(tracks)
+            self._set_text(status, "Card read successfully")
+            toast("Card read successfully", False)
         else:
-            self.status_label.set_text(f"Read failed: {result.message}")
-            self.show_toast(result.message, True)
+            self._set_text(status, f"Read failed: {result.message}")
+            toast(result.message, True)
 
     def _set_reading_state(self, reading: bool):
-        """Set UI state during reading."""
-        self.read_btn.set_sensitive(not reading)
-        self.spinner.set_visible(reading)
-        if reading:
-            self.spinner.start()
-        else:
-            self.spinner.stop()
+        """Set UI state during reading, the read button cancels meanwhile."""
+        self._reading = reading
+        self.read_btn.set_label("Cancel" if reading else "Read Card")
 
     def _display_tracks(self, tracks: list[TrackData]):
         """Display track data in the UI."""
-        entries = {
-            1: self.track1_entry,
-            2: self.track2_entry,
-            3: self.track3_entry,
-        }
-
+        entries = self.track_entries
+        validity = self._track_validity
+        set_text = self._set_text
         for track in tracks:
-            entry = entries.get(track.track_number)
-            if entry:
-                entry.set_text(track.data)
-
-                # Set style based on validity
-                entry.remove_css_class("success")
-                entry.remove_css_class("error")
-                if track.is_valid:
-                    entry.add_css_class("success")
-                else:
-                    entry.add_css_class("error")
+            index = track.track_number - 1
+            if not 0 <= index < len(entries):
+                continue
+            entry = entries[index]
+            set_text(entry, track.data)
+
+            # Set style based on validity, only restyle on change
+            is_valid = track.is_valid
+            if validity[index] != is_valid:
+                entry.remove_css_class("error" if is_valid else "success")
+                entry.add_css_class("success" if is_valid else "error")
+                validity[index] = is_valid
 
     def _clear_tracks(self):
         """Clear track display."""
-        self.track1_entry.set_text("")
-        self.track2_entry.set_text("")
-        self.track3_entry.set_text("")
+        for entry in self.track_entries:
+            self._set_text(entry, "")
         self.current_tracks = []
+        self.current_tracks_by_number = {}
+        self._clipboard_text = ""
+
+    @staticmethod
+    def _set_text(widget, text: str):
+        """Set label or entry text, skipping the notify when unchanged."""
+        if widget.get_text() != text:
+            widget.set_text(text)
 
     def _on_clear_clicked(self, button):
         """Handle clear button click."""
         self._clear_tracks()
         self.status_label.set_text("Ready")
 
+    def _on_map(self, widget):
+        """Cache the display clipboard once the panel is on screen."""
+        if self._clipboard is None:
+            self._clipboard = widget.get_clipboard()
+
     def _on_copy_clicked(self, button):
         """Copy track data to clipboard."""
         if not self.current_tracks:
             self.show_toast("No data to copy", True)
             return
 
-        text_lines = []
-        for track in self.current_tracks:
-            text_lines.append(f"Track {track.track_number}: {track.data}")
-
-        text = "\n".join(text_lines)
-
-        clipboard = self.get_clipboard()
-        clipboard.set(text)
+        self._clipboard.set(self._clipboard_text)
         self.show_toast("Copied to clipboard", False)
 
     def _on_save_clicked(self, button):
@@ -263,41 +327,49 @@ class ReadPanel(Gtk.Box):
             self.show_toast("No data to save", True)
             return
 
-        dialog = Gtk.FileChooserNative.new(
-            "Save Card Data",
-            self.get_root(),
-            Gtk.FileChooserAction.SAVE,
-            "_Save",
-            "_Cancel"
-        )
+        # Build the dialog on first use and reuse it afterwards
+        if self._save_dialog is None:
+            dialog = Gtk.FileChooserNative.new(
+                "Save Card Data",
+                self.get_root(),
+                Gtk.FileChooserAction.SAVE,
+                "_Save",
+                "_Cancel"
+            )
+
+            # Add file filters
+            json_filter = Gtk.FileFilter()
+            json_filter.set_name("JSON files")
+            json_filter.add_pattern("*.json")
+            dialog.add_filter(json_filter)
 
-        # Add file filters
-        json_filter = Gtk.FileFilter()
-        json_filter.set_name("JSON files")
-        json_filter.add_pattern("*.json")
-        dialog.add_filter(json_filter)
+            csv_filter = Gtk.FileFilter()
+            csv_filter.set_name("CSV files")
+            csv_filter.add_pattern("*.csv")
+            dialog.add_filter(csv_filter)
 
-        csv_filter = Gtk.FileFilter()
-        csv_filter.set_name("CSV files")
-        csv_filter.add_pattern("*.csv")
-        dialog.add_filter(csv_filter)
+            dialog.connect("response", self._on_save_response)
+            self._save_dialog = dialog
 
-        dialog.set_current_name("card_data.json")
-        dialog.connect("response", self._on_save_response)
-        dialog.show()
+        self._save_dialog.set_current_name("card_data.json")
+        self._save_dialog.show()
 
     def _on_save_response(self, dialog, response):
         """Handle save dialog response."""
         if response == Gtk.ResponseType.ACCEPT:
-            filepath = dialog.get_file().get_path()
-
-            from pathlib import Path
-            success, message = self.file_manager.save_tracks(
-                Path(filepath),
-                self.current_tracks
-            )
-
-            if success:
-                self.show_toast(message, False)
-            else:
-                self.show_toast(message, True)
+            path = Path(dialog.get_file().get_path())
+            # Snapshot the tracks so a new read can't change what gets saved
+            tracks = list(self.current_tracks)
+
+            thread = Thread(target=self._do_save, args=(path, tracks), daemon=True)
+            thread.start()
+
+    def _do_save(self, path: Path, tracks: list[TrackData]):
+        """Save tracks off the main loop and report back on it."""
+        success, message = self.file_manager.save_tracks(path, tracks)
+        GLib.idle_add(self._save_complete_cb, success, message, priority=GLib.PRIORITY_DEFAULT)
+
+    def _on_save_complete(self, success: bool, message: str):
+        """Handle save operation result."""
+        self.show_toast(message, not success)
+        return GLib.SOURCE_REMOVE
@@ -7,10 +7,10 @@ gi.require_version('Adw', '1')
 
 from gi.repository import Gtk, Adw, GLib
 from typing import Callable
-from threading import Thread
 
 from ..msr605x.commands import MSR605XCommands
 from ..msr605x.constants import Coercivity, TrackNumber, BPI, BPC
+from .io_pool import IO_POOL
 
 
 class SettingsPanel(Gtk.Box):
@@ -26,10 +26,7 @@ class SettingsPanel(Gtk.Box):
         self.commands = commands
         self.show_toast = show_toast
 
-        self.set_margin_top(24)
-        self.set_margin_bottom(24)
-        self.set_margin_start(24)
-        self.set_margin_end(24)
+        self.add_css_class("panel-padded-24")
 
         self._build_ui()
 
@@ -77,10 +74,7 @@ class SettingsPanel(Gtk.Box):
         frame.set_label("Coercivity")
 
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
+        box.add_css_class("panel-padded-12")
 
         # Description
         desc = Gtk.Label(
@@ -121,10 +115,7 @@ class SettingsPanel(Gtk.Box):
         frame.set_label("Bits Per Inch (BPI)")
 
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
+        box.add_css_class("panel-padded-12")
 
         desc = Gtk.Label(
             label="Configure the recording density for each track. "
@@ -173,10 +164,7 @@ class SettingsPanel(Gtk.Box):
         frame.set_label("Bits Per Character (BPC)")
 
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
+        box.add_css_class("panel-padded-12")
 
         desc = Gtk.Label(
             label="Configure the character encoding for each track. "
@@ -225,10 +213,7 @@ class SettingsPanel(Gtk.Box):
         frame.set_label("Leading Zeros")
 
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
+        box.add_css_class("panel-padded-12")
 
         desc = Gtk.Label(
             label="Configure the number of leading zeros before data on each track."
@@ -272,10 +257,7 @@ class SettingsPanel(Gtk.Box):
         frame.set_label("Device Tests")
 
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        box.set_margin_top(12)
-        box.set_margin_bottom(12)
-        box.set_margin_start(12)
-        box.set_margin_end(12)
+        box.add_css_class("panel-padded-12")
 
         desc = Gtk.Label(
             label="Run diagnostic tests on the MSR605X device."
@@ -328,7 +310,7 @@ class SettingsPanel(Gtk.Box):
             result = self.commands.set_coercivity(coercivity)
             GLib.idle_add(self._show_result, result.message, result.success)
 
-        Thread(target=do_apply, daemon=True).start()
+        IO_POOL.submit(do_apply)
 
     def _on_apply_bpi(self, button):
         """Apply BPI settings."""
@@ -343,7 +325,7 @@ class SettingsPanel(Gtk.Box):
 
             GLib.idle_add(self._show_result, "BPI settings applied", True)
 
-        Thread(target=do_apply, daemon=True).start()
+        IO_POOL.submit(do_apply)
 
     def _on_apply_bpc(self, button):
         """Apply BPC settings."""
@@ -358,7 +340,7 @@ class SettingsPanel(Gtk.Box):
 
             GLib.idle_add(self._show_result, "BPC settings applied", True)
 
-        Thread(target=do_apply, daemon=True).start()
+        IO_POOL.submit(do_apply)
 
     def _on_apply_leading_zeros(self, button):
         """Apply leading zeros settings."""
@@ -372,7 +354,7 @@ class SettingsPanel(Gtk.Box):
 
             GLib.idle_add(self._show_result, "Leading zeros applied", True)
 
-        Thread(target=do_apply, daemon=True).start()
+        IO_POOL.submit(do_apply)
 
     def _on_test_comm(self, button):
         """Test communication."""
@@ -380,7 +362,7 @@ class SettingsPanel(Gtk.Box):
             result = self.commands.test_communication()
             GLib.idle_add(self._show_result, result.message, result.success)
 
-        Thread(target=do_test, daemon=True).start()
+        IO_POOL.submit(do_test)
 
     def _on_test_ram(self, button):
         """Test RAM."""
@@ -388,7 +370,7 @@ class SettingsPanel(Gtk.Box):
             result = self.commands.test_ram()
             GLib.idle_add(self._show_result, result.message, result.success)
 
-        Thread(target=do_test, daemon=True).start()
+        IO_POOL.submit(do_test)
 
     def _on_test_sensor(self, button):
         """Test sensor."""
@@ -396,7 +378,7 @@ class SettingsPanel(Gtk.Box):
             result = self.commands.test_sensor()
             GLib.idle_add(self._show_result, result.message, result.success)
 
-        Thread(target=do_test, daemon=True).start()
+        IO_POOL.submit(do_test)
 
     def _on_get_firmware(self, button):
         """Get firmware version."""
@@ -404,7 +386,7 @@ class SettingsPanel(Gtk.Box):
             result = self.commands.get_firmware_version()
             GLib.idle_add(self._show_result, result.message, result.success)
 
-        Thread(target=do_get, daemon=True).start()
+        IO_POOL.submit(do_get)
 
     def _on_reset_device(self, button):
         """Reset device."""
@@ -412,7 +394,7 @@ class SettingsPanel(Gtk.Box):
             result = self.commands.reset()
             GLib.idle_add(self._show_result, result.message, result.success)
 
-        Thread(target=do_reset, daemon=True).start()
+        IO_POOL.submit(do_reset)
 
     def _on_led_clicked(self, button, color: str):
         """Control LED."""
@@ -423,7 +405,7 @@ class SettingsPanel(Gtk.Box):
                 result = self.commands.led_on(color)
             GLib.idle_add(self._show_result, result.message, result.success)
 
-        Thread(target=do_led, daemon=True).start()
+        IO_POOL.submit(do_led)
 
     def _show_result(self, message: str, success: bool):
         """Show result message."""
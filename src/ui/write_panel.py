@@ -5,15 +5,59 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib
+from gi.repository import Gtk, Adw, GLib, Pango
 from typing import Callable, Optional
-from threading import Thread
+from concurrent.futures import Future
 from pathlib import Path
+import string
 
-from ..msr605x.commands import MSR605XCommands
+from ..msr605x.commands import MSR605XCommands, CommandResult
 from ..msr605x.parser import TrackData
-from ..msr605x.constants import DataFormat, TrackSpec
+from ..msr605x.constants import DataFormat, TrackSpec, ErrorCode
 from ..utils.file_io import FileManager
+from .io_pool import IO_POOL
+
+# Verify swipe wait: poll interval, overall timeout and time allowed for the
+# rest of a response once its first report has arrived
+VERIFY_POLL_MS = 50
+VERIFY_TIMEOUT_MS = 15000
+VERIFY_DRAIN_MS = 500
+
+# Status label width in characters, fixed so text updates don't resize the layout
+STATUS_WIDTH_CHARS = 48
+
+# Characters accepted in raw (hex) track input, spaces are allowed by bytes.fromhex
+HEX_CHARS = frozenset(string.hexdigits + " ")
+
+# Track inputs as (track number, label, description, max length), built once
+_TRACK_INPUTS = tuple(
+    (track_num, spec['name'], f"{kind}, max {spec['max_chars']} chars", spec['max_chars'])
+    for track_num, spec, kind in (
+        (1, TrackSpec.TRACK_1, "Alphanumeric"),
+        (2, TrackSpec.TRACK_2, "Numeric"),
+        (3, TrackSpec.TRACK_3, "Numeric"),
+    )
+)
+
+# Track entry placeholders for tracks 1-3 per format
+_ISO_PLACEHOLDERS = ("Enter data...",) * 3
+_RAW_PLACEHOLDERS = ("Enter hex data (e.g., 1A2B3C)...", "Enter hex data...", "Enter hex data...")
+
+# Write format choices as (id, label), in drop-down order
+WRITE_FORMATS = (
+    ("iso", "ISO (Standard)"),
+    ("raw", "Raw Data (Hex)"),
+)
+
+
+def _parse_hex_tracks(*tracks: Optional[str]) -> tuple[Optional[bytes], ...]:
+    """
+    Convert hex track strings to bytes, leaving empty tracks as None.
+
+    Raises:
+        ValueError: If a track is not valid hex.
+    """
+    return tuple(bytes.fromhex(track) if track else None for track in tracks)
 
 
 class WritePanel(Gtk.Box):
@@ -30,115 +74,92 @@ class WritePanel(Gtk.Box):
         self.commands = commands
         self.show_toast = show_toast
         self.file_manager = file_manager
+        # Hex input filter handler on each entry's delegate editable, only
+        # unblocked in raw format
+        self._hex_filters: dict[Gtk.Entry, tuple[Gtk.Editable, int]] = {}
+        self._current_format = WRITE_FORMATS[0][0]
+        # Character count handler and its data per entry, for bulk text updates
+        self._count_handlers: dict[Gtk.Entry, tuple[int, Gtk.Label, int]] = {}
+        self._load_dialog: Optional[Gtk.FileChooserNative] = None
 
-        self.set_margin_top(24)
-        self.set_margin_bottom(24)
-        self.set_margin_start(24)
-        self.set_margin_end(24)
+        self.add_css_class("panel-padded-24")
 
         self._build_ui()
 
     def _build_ui(self):
         """Build the panel UI."""
+        # Static widget properties are passed at construction so each widget is
+        # set up in a single call instead of one setter call per property
+
         # Title
-        title = Gtk.Label(label="Write Card")
-        title.add_css_class("panel-title")
-        title.set_xalign(0)
+        title = Gtk.Label(label="Write Card", xalign=0, css_classes=["panel-title"])
         self.append(title)
 
         # Description
         desc = Gtk.Label(
-            label="Enter data for each track, then click 'Write' and swipe a blank card."
+            label="Enter data for each track, then click 'Write' and swipe a blank card.",
+            xalign=0,
+            wrap=True,
+            css_classes=["dim-label"]
         )
-        desc.set_xalign(0)
-        desc.set_wrap(True)
-        desc.add_css_class("dim-label")
         self.append(desc)
 
         # Format selection
-        format_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
-        format_box.set_margin_top(12)
+        format_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12, margin_top=12)
 
         format_label = Gtk.Label(label="Write Format:")
         format_box.append(format_label)
 
-        self.format_combo = Gtk.ComboBoxText()
-        self.format_combo.append("iso", "ISO (Standard)")
-        self.format_combo.append("raw", "Raw Data (Hex)")
-        self.format_combo.set_active_id("iso")
-        self.format_combo.connect("changed", self._on_format_changed)
+        self.format_combo = Gtk.DropDown.new_from_strings([label for _, label in WRITE_FORMATS])
+        self.format_combo.set_selected(0)
+        self.format_combo.connect("notify::selected", self._on_format_changed)
         format_box.append(self.format_combo)
 
         self.append(format_box)
 
         # Track inputs
-        tracks_frame = Gtk.Frame()
-        tracks_frame.set_label("Track Data")
-        tracks_frame.set_margin_top(12)
-
-        tracks_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        tracks_box.set_margin_top(12)
-        tracks_box.set_margin_bottom(12)
-        tracks_box.set_margin_start(12)
-        tracks_box.set_margin_end(12)
-
-        # Track 1
-        self.track1_box = self._create_track_input(
-            "Track 1",
-            f"Alphanumeric, max {TrackSpec.TRACK_1['max_chars']} chars",
-            TrackSpec.TRACK_1['max_chars']
-        )
-        self.track1_entry = self._get_entry_from_box(self.track1_box)
-        self.track1_check = self._get_check_from_box(self.track1_box)
-        tracks_box.append(self.track1_box)
-
-        # Track 2
-        self.track2_box = self._create_track_input(
-            "Track 2",
-            f"Numeric, max {TrackSpec.TRACK_2['max_chars']} chars",
-            TrackSpec.TRACK_2['max_chars']
-        )
-        self.track2_entry = self._get_entry_from_box(self.track2_box)
-        self.track2_check = self._get_check_from_box(self.track2_box)
-        tracks_box.append(self.track2_box)
-
-        # Track 3
-        self.track3_box = self._create_track_input(
-            "Track 3",
-            f"Numeric, max {TrackSpec.TRACK_3['max_chars']} chars",
-            TrackSpec.TRACK_3['max_chars']
+        tracks_frame = Gtk.Frame(label="Track Data", margin_top=12)
+
+        tracks_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=12, css_classes=["panel-padded-12"]
         )
-        self.track3_entry = self._get_entry_from_box(self.track3_box)
-        self.track3_check = self._get_check_from_box(self.track3_box)
-        tracks_box.append(self.track3_box)
+
+        # Track inputs and their enable checkboxes, keyed by track number
+        self.track_entries: dict[int, Gtk.Entry] = {}
+        self.track_checks: dict[int, Gtk.CheckButton] = {}
+        for track_num, label, description, max_length in _TRACK_INPUTS:
+            track_box, entry, check = self._create_track_input(label, description, max_length)
+            self.track_entries[track_num] = entry
+            self.track_checks[track_num] = check
+            tracks_box.append(track_box)
 
         tracks_frame.set_child(tracks_box)
         self.append(tracks_frame)
 
         # Options
-        options_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=24)
-        options_box.set_margin_top(12)
+        options_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=24, margin_top=12)
 
-        self.verify_check = Gtk.CheckButton(label="Verify after write")
-        self.verify_check.set_active(True)
+        self.verify_check = Gtk.CheckButton(label="Verify after write", active=True)
         options_box.append(self.verify_check)
 
         self.append(options_box)
 
         # Status
-        self.status_label = Gtk.Label(label="Ready")
-        self.status_label.set_xalign(0)
-        self.status_label.set_margin_top(8)
+        # Single line with a fixed width, so status changes repaint the label
+        # without resizing the panel
+        self.status_label = Gtk.Label(
+            label="Ready", xalign=0, margin_top=8, single_line_mode=True,
+            width_chars=STATUS_WIDTH_CHARS, max_width_chars=STATUS_WIDTH_CHARS,
+            ellipsize=Pango.EllipsizeMode.END
+        )
         self.append(self.status_label)
 
         # Spinner
-        self.spinner = Gtk.Spinner()
-        self.spinner.set_visible(False)
+        self.spinner = Gtk.Spinner(visible=False)
         self.append(self.spinner)
 
         # Action buttons
-        action_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        action_box.set_margin_top(12)
+        action_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8, margin_top=12)
 
         load_btn = Gtk.Button(label="Load from File")
         load_btn.connect("clicked", self._on_load_clicked)
@@ -148,146 +169,208 @@ class WritePanel(Gtk.Box):
         clear_btn.connect("clicked", self._on_clear_clicked)
         action_box.append(clear_btn)
 
-        # Spacer
-        spacer = Gtk.Box()
-        spacer.set_hexpand(True)
-        action_box.append(spacer)
-
-        self.write_btn = Gtk.Button(label="Write Card")
-        self.write_btn.add_css_class("suggested-action")
-        self.write_btn.add_css_class("action-button")
+        # Write button takes the spare width and sits at its end, pushing the
+        # write buttons to the right without a spacer widget
+        self.write_btn = Gtk.Button(
+            label="Write Card",
+            hexpand=True,
+            halign=Gtk.Align.END,
+            css_classes=["suggested-action", "action-button"]
+        )
         self.write_btn.connect("clicked", self._on_write_clicked)
         action_box.append(self.write_btn)
 
-        self.batch_btn = Gtk.Button(label="Batch Write...")
-        self.batch_btn.add_css_class("action-button")
+        self.batch_btn = Gtk.Button(label="Batch Write...", css_classes=["action-button"])
         self.batch_btn.connect("clicked", self._on_batch_write_clicked)
         action_box.append(self.batch_btn)
 
         self.append(action_box)
 
-    def _create_track_input(self, label: str, description: str, max_length: int) -> Gtk.Box:
-        """Create a track input widget."""
+    def _create_track_input(
+        self, label: str, description: str, max_length: int
+    ) -> tuple[Gtk.Box, Gtk.Entry, Gtk.CheckButton]:
+        """Create a track input widget and return it with its entry and checkbox."""
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
 
         # Header with checkbox
         header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
 
-        check = Gtk.CheckButton()
-        check.set_active(True)
+        check = Gtk.CheckButton(active=True)
         header_box.append(check)
 
-        track_label = Gtk.Label(label=label)
-        track_label.add_css_class("track-label")
-        track_label.set_xalign(0)
+        track_label = Gtk.Label(label=label, xalign=0, css_classes=["track-label"])
         header_box.append(track_label)
 
-        desc_label = Gtk.Label(label=f"({description})")
-        desc_label.add_css_class("dim-label")
+        desc_label = Gtk.Label(label=f"({description})", css_classes=["dim-label"])
         header_box.append(desc_label)
 
         box.append(header_box)
 
         # Entry
-        entry = Gtk.Entry()
-        entry.set_max_length(max_length)
-        entry.add_css_class("track-entry")
-        entry.set_placeholder_text("Enter data...")
-        entry.connect("changed", self._on_entry_changed)
+        entry = Gtk.Entry(
+            max_length=max_length,
+            placeholder_text="Enter data...",
+            css_classes=["track-entry"]
+        )
         box.append(entry)
 
-        # Character count
-        count_label = Gtk.Label(label=f"0/{max_length}")
-        count_label.set_xalign(1)
-        count_label.add_css_class("dim-label")
-        entry.count_label = count_label
-        entry.max_length = max_length
+        # Character count, updated from the buffer length without copying the text
+        count_label = Gtk.Label(label=f"0/{max_length}", xalign=1, css_classes=["dim-label"])
+        buffer = entry.get_buffer()
+        count_id = buffer.connect("notify::length", self._on_buffer_length, count_label, max_length)
+        self._count_handlers[entry] = (count_id, count_label, max_length)
         box.append(count_label)
 
-        return box
-
-    def _get_entry_from_box(self, box: Gtk.Box) -> Gtk.Entry:
-        """Get entry widget from track box."""
-        child = box.get_first_child()
-        while child:
-            if isinstance(child, Gtk.Entry):
-                return child
-            child = child.get_next_sibling()
-        return None
-
-    def _get_check_from_box(self, box: Gtk.Box) -> Gtk.CheckButton:
-        """Get checkbox widget from track box."""
-        header = box.get_first_child()
-        if header:
-            child = header.get_first_child()
-            if isinstance(child, Gtk.CheckButton):
-                return child
-        return None
-
-    def _on_entry_changed(self, entry):
-        """Update character count on entry change."""
-        if hasattr(entry, 'count_label'):
-            length = len(entry.get_text())
-            entry.count_label.set_text(f"{length}/{entry.max_length}")
-
-    def _on_format_changed(self, combo):
+        # Reject non-hex input while the raw format is selected, stopped
+        # before it reaches the buffer so the cursor and undo stay consistent
+        editable = entry.get_delegate()
+        handler_id = editable.connect("insert-text", self._on_hex_insert)
+        editable.handler_block(handler_id)
+        self._hex_filters[entry] = (editable, handler_id)
+
+        return box, entry, check
+
+    def _on_buffer_length(self, buffer, pspec, count_label: Gtk.Label, max_length: int):
+        """Update character count when the entry length changes."""
+        count_label.set_text(f"{buffer.get_length()}/{max_length}")
+
+    def _load_entry_text(self, entry: Gtk.Entry, text: str):
+        """Replace entry text, updating the character count once.
+
+        The hex filter is bypassed, invalid loaded data is reported when writing.
+        """
+        if entry.get_text() == text:
+            return
+        buffer = entry.get_buffer()
+        count_id, count_label, max_length = self._count_handlers[entry]
+        editable, hex_id = self._hex_filters[entry]
+        buffer.handler_block(count_id)
+        editable.handler_block(hex_id)
+        entry.set_text(text)
+        editable.handler_unblock(hex_id)
+        buffer.handler_unblock(count_id)
+        self._on_buffer_length(buffer, None, count_label, max_length)
+
+    def _on_hex_insert(self, editable, text: str, length: int, position):
+        """Stop an insert that is not hex."""
+        if not HEX_CHARS.issuperset(text):
+            editable.stop_emission_by_name("insert-text")
+
+    def _get_format_id(self) -> str:
+        """Get the id of the selected write format."""
+        return WRITE_FORMATS[self.format_combo.get_selected()][0]
+
+    def _on_format_changed(self, dropdown, pspec):
         """Handle format selection change."""
-        format_id = combo.get_active_id()
-        if format_id == "raw":
-            self.track1_entry.set_placeholder_text("Enter hex data (e.g., 1A2B3C)...")
-            self.track2_entry.set_placeholder_text("Enter hex data...")
-            self.track3_entry.set_placeholder_text("Enter hex data...")
-        else:
-            self.track1_entry.set_placeholder_text("Enter data...")
-            self.track2_entry.set_placeholder_text("Enter data...")
-            self.track3_entry.set_placeholder_text("Enter data...")
+        format_id = self._get_format_id()
+        if format_id == self._current_format:
+            return
+        self._current_format = format_id
+
+        raw = format_id == "raw"
+        placeholders = _RAW_PLACEHOLDERS if raw else _ISO_PLACEHOLDERS
+        for entry, placeholder in zip(self.track_entries.values(), placeholders):
+            entry.set_placeholder_text(placeholder)
+
+        # Hex input filter is only active in raw format
+        for editable, handler_id in self._hex_filters.values():
+            if raw:
+                editable.handler_unblock(handler_id)
+            else:
+                editable.handler_block(handler_id)
+
+    def _get_selected_tracks(self) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        """Get entered data for tracks 1-3, None for tracks that are unchecked."""
+        checks = self.track_checks
+        track1, track2, track3 = (
+            entry.get_text() if checks[track_num].get_active() else None
+            for track_num, entry in self.track_entries.items()
+        )
+        return track1, track2, track3
 
     def _on_write_clicked(self, button):
         """Handle write button click."""
         # Get track data
-        track1 = self.track1_entry.get_text() if self.track1_check.get_active() else None
-        track2 = self.track2_entry.get_text() if self.track2_check.get_active() else None
-        track3 = self.track3_entry.get_text() if self.track3_check.get_active() else None
+        track1, track2, track3 = self._get_selected_tracks()
 
         if not any([track1, track2, track3]):
             self.show_toast("Please enter data for at least one track", True)
             return
 
-        self._set_writing_state(True)
-        self.status_label.set_text("Waiting for card swipe...")
-
-        format_id = self.format_combo.get_active_id()
+        format_id = self._get_format_id()
         verify = self.verify_check.get_active()
 
+        # Convert hex strings to bytes before starting, so bad input never
+        # reaches the device
+        if format_id == "raw":
+            try:
+                raw_tracks = _parse_hex_tracks(track1, track2, track3)
+            except ValueError as e:
+                self._show_status(f"Write failed: Invalid hex data: {e}", True)
+                self.show_toast(f"Invalid hex data: {e}", True)
+                return
+
+        self._set_writing_state(True)
+        self._show_status("Waiting for card swipe...")
+
         def do_write():
             if format_id == "raw":
-                # Convert hex strings to bytes
-                try:
-                    t1 = bytes.fromhex(track1) if track1 else None
-                    t2 = bytes.fromhex(track2) if track2 else None
-                    t3 = bytes.fromhex(track3) if track3 else None
-                    result = self.commands.write_raw(t1, t2, t3, timeout_ms=15000)
-                except ValueError as e:
-                    from ..msr605x.commands import CommandResult
-                    from ..msr605x.constants import ErrorCode
-                    result = CommandResult(
-                        success=False,
-                        error_code=ErrorCode.COMMAND_FORMAT_ERROR,
-                        message=f"Invalid hex data: {e}"
-                    )
+                result = self.commands.write_raw(*raw_tracks, timeout_ms=15000)
             else:
                 result = self.commands.write_iso(track1, track2, track3, timeout_ms=15000)
 
-            # Verify if requested
+            # Verify if requested, the verify swipe is awaited on the main loop
             if result.success and verify:
-                GLib.idle_add(lambda: self.status_label.set_text("Verifying... swipe card again"))
-                verify_result = self.commands.compare_card(track1, track2, track3, timeout_ms=15000)
-                GLib.idle_add(self._on_write_complete, result, verify_result)
+                GLib.idle_add(self._start_verify, result, track1, track2, track3)
             else:
                 GLib.idle_add(self._on_write_complete, result, None)
 
-        thread = Thread(target=do_write, daemon=True)
-        thread.start()
+        IO_POOL.submit(do_write)
+
+    def _start_verify(self, write_result, track1, track2, track3):
+        """Send the verify read and poll for the swipe without blocking a thread."""
+        self._show_status("Verifying... swipe card again")
+
+        if not self.commands.start_compare():
+            verify_result = CommandResult(
+                success=False,
+                error_code=ErrorCode.COMMUNICATION_ERROR,
+                message="Read failed: Failed to send read command"
+            )
+            self._on_write_complete(write_result, verify_result)
+            return GLib.SOURCE_REMOVE
+
+        deadline = GLib.get_monotonic_time() + VERIFY_TIMEOUT_MS * 1000
+        GLib.timeout_add(
+            VERIFY_POLL_MS, self._poll_verify, write_result, (track1, track2, track3), deadline
+        )
+        return GLib.SOURCE_REMOVE
+
+    def _poll_verify(self, write_result, tracks, deadline: int):
+        """Finish the verify once the card response arrives or time runs out."""
+        if self.commands.response_pending():
+            # The rest of the response follows the first report closely, wait
+            # for it on the worker so the main loop keeps running
+            def do_finish():
+                verify_result = self.commands.finish_compare(*tracks, timeout_ms=VERIFY_DRAIN_MS)
+                GLib.idle_add(self._on_write_complete, write_result, verify_result)
+
+            IO_POOL.submit(do_finish)
+            return GLib.SOURCE_REMOVE
+
+        if GLib.get_monotonic_time() < deadline:
+            return GLib.SOURCE_CONTINUE
+
+        self._on_write_complete(write_result, self.commands.finish_compare(*tracks, timeout_ms=0))
+        return GLib.SOURCE_REMOVE
+
+    def _show_status(self, text: str, error: bool = False):
+        """Set the status text, styled as an error if requested."""
+        self.status_label.set_text(text)
+        if error:
+            self.status_label.add_css_class("error")
+        else:
+            self.status_label.remove_css_class("error")
 
     def _on_write_complete(self, write_result, verify_result=None):
         """Handle write operation result."""
@@ -299,16 +382,16 @@ class WritePanel(Gtk.Box):
         if write_result.success:
             if verify_result:
                 if verify_result.success:
-                    self.status_label.set_text("Write and verify successful")
+                    self._show_status("Write and verify successful")
                     self.show_toast("Card written and verified", False)
                 else:
-                    self.status_label.set_text(f"Verify failed: {verify_result.message}")
+                    self._show_status(f"Verify failed: {verify_result.message}", True)
                     self.show_toast(f"Write OK, verify failed: {verify_result.message}", True)
             else:
-                self.status_label.set_text("Card written successfully")
+                self._show_status("Card written successfully")
                 self.show_toast("Card written successfully", False)
         else:
-            self.status_label.set_text(f"Write failed: {write_result.message}")
+            self._show_status(f"Write failed: {write_result.message}", True)
             self.show_toast(write_result.message, True)
 
     def _set_writing_state(self, writing: bool):
@@ -322,13 +405,19 @@ class WritePanel(Gtk.Box):
 
     def _on_clear_clicked(self, button):
         """Clear all track inputs."""
-        self.track1_entry.set_text("")
-        self.track2_entry.set_text("")
-        self.track3_entry.set_text("")
-        self.status_label.set_text("Ready")
+        for entry in self.track_entries.values():
+            self._load_entry_text(entry, "")
+        self._show_status("Ready")
 
     def _on_load_clicked(self, button):
         """Load track data from file."""
+        # Build the dialog on first use and reuse it afterwards
+        if self._load_dialog is None:
+            self._load_dialog = self._build_load_dialog()
+        self._load_dialog.show()
+
+    def _build_load_dialog(self) -> Gtk.FileChooserNative:
+        """Create the load dialog with its file filters."""
         dialog = Gtk.FileChooserNative.new(
             "Load Card Data",
             self.get_root(),
@@ -355,7 +444,7 @@ class WritePanel(Gtk.Box):
         dialog.add_filter(all_filter)
 
         dialog.connect("response", self._on_load_response)
-        dialog.show()
+        return dialog
 
     def _on_load_response(self, dialog, response):
         """Handle load dialog response."""
@@ -372,29 +461,22 @@ class WritePanel(Gtk.Box):
 
     def _populate_from_tracks(self, tracks: list[TrackData]):
         """Populate entries from loaded tracks."""
-        entries = {
-            1: self.track1_entry,
-            2: self.track2_entry,
-            3: self.track3_entry,
-        }
-
         for track in tracks:
-            entry = entries.get(track.track_number)
+            entry = self.track_entries.get(track.track_number)
             if entry:
-                entry.set_text(track.data)
+                self._load_entry_text(entry, track.data)
 
     def set_track_data(self, track1: str = "", track2: str = "", track3: str = ""):
         """Set track data programmatically."""
-        self.track1_entry.set_text(track1)
-        self.track2_entry.set_text(track2)
-        self.track3_entry.set_text(track3)
+        entries = self.track_entries
+        self._load_entry_text(entries[1], track1)
+        self._load_entry_text(entries[2], track2)
+        self._load_entry_text(entries[3], track3)
 
     def _on_batch_write_clicked(self, button):
         """Open batch write dialog."""
         # Get track data
-        track1 = self.track1_entry.get_text() if self.track1_check.get_active() else None
-        track2 = self.track2_entry.get_text() if self.track2_check.get_active() else None
-        track3 = self.track3_entry.get_text() if self.track3_check.get_active() else None
+        track1, track2, track3 = self._get_selected_tracks()
 
         if not any([track1, track2, track3]):
             self.show_toast("Please enter data for at least one track", True)
@@ -404,7 +486,7 @@ class WritePanel(Gtk.Box):
             self.get_root(),
             self.commands,
             track1, track2, track3,
-            self.format_combo.get_active_id()
+            self._get_format_id()
         )
         dialog.present()
 
@@ -420,9 +502,20 @@ class BatchWriteDialog(Adw.Window):
         self.track2 = track2
         self.track3 = track3
         self.format_id = format_id
+        # Raw track bytes, parsed once for the whole batch
+        self._raw_tracks: tuple[Optional[bytes], ...] = (None, None, None)
+        self._raw_error: Optional[str] = None
+        if format_id == "raw":
+            try:
+                self._raw_tracks = _parse_hex_tracks(track1, track2, track3)
+            except ValueError as e:
+                self._raw_error = f"Invalid hex: {e}"
         self.cards_written = 0
         self.is_running = False
         self.has_error = False
+        # Card write queued on the shared I/O worker, dropped if the dialog closes first
+        self._future: Optional[Future] = None
+        self.connect("destroy", self._on_destroy)
 
         self.set_transient_for(parent)
         self.set_modal(True)
@@ -431,86 +524,79 @@ class BatchWriteDialog(Adw.Window):
 
         self._build_ui()
 
+        if self._raw_error:
+            self.start_btn.set_sensitive(False)
+            self.error_label.set_text(self._raw_error)
+            self.error_box.set_visible(True)
+
     def _build_ui(self):
         """Build dialog UI."""
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
-        main_box.set_margin_top(24)
-        main_box.set_margin_bottom(24)
-        main_box.set_margin_start(24)
-        main_box.set_margin_end(24)
+        main_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=16, css_classes=["panel-padded-24"]
+        )
         self.set_content(main_box)
 
         # Title
-        title = Gtk.Label(label="Batch Write Mode")
-        title.add_css_class("title-1")
+        title = Gtk.Label(label="Batch Write Mode", css_classes=["title-1"])
         main_box.append(title)
 
         # Counter display
-        counter_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8)
-        counter_box.set_margin_top(24)
+        counter_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=8, margin_top=24)
 
-        self.counter_label = Gtk.Label(label="0")
-        self.counter_label.add_css_class("title-1")
-        self.counter_label.set_markup("<span size='xx-large' weight='bold'>0</span>")
+        # Counter style is set once as attributes, updates are plain text
+        counter_attrs = Pango.AttrList()
+        counter_attrs.insert(Pango.attr_scale_new(Pango.SCALE_XX_LARGE))
+        counter_attrs.insert(Pango.attr_weight_new(Pango.Weight.BOLD))
+        self.counter_label = Gtk.Label(label="0", attributes=counter_attrs, css_classes=["title-1"])
         counter_box.append(self.counter_label)
 
-        counter_desc = Gtk.Label(label="Cards Written Successfully")
-        counter_desc.add_css_class("dim-label")
+        counter_desc = Gtk.Label(label="Cards Written Successfully", css_classes=["dim-label"])
         counter_box.append(counter_desc)
 
         main_box.append(counter_box)
 
         # Status
-        self.status_label = Gtk.Label(label="Click Start to begin writing cards")
-        self.status_label.set_margin_top(16)
-        self.status_label.set_wrap(True)
+        self.status_label = Gtk.Label(
+            label="Click Start to begin writing cards", margin_top=16, single_line_mode=True,
+            width_chars=STATUS_WIDTH_CHARS, max_width_chars=STATUS_WIDTH_CHARS,
+            ellipsize=Pango.EllipsizeMode.END
+        )
         main_box.append(self.status_label)
 
         # Spinner
-        self.spinner = Gtk.Spinner()
-        self.spinner.set_visible(False)
+        self.spinner = Gtk.Spinner(visible=False)
         main_box.append(self.spinner)
 
         # Error display
-        self.error_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=4)
-        self.error_box.set_visible(False)
-        self.error_box.set_margin_top(16)
+        self.error_box = Gtk.Box(
+            orientation=Gtk.Orientation.VERTICAL, spacing=4, visible=False, margin_top=16
+        )
 
-        error_icon = Gtk.Image.new_from_icon_name("dialog-error-symbolic")
-        error_icon.set_icon_size(Gtk.IconSize.LARGE)
+        error_icon = Gtk.Image(icon_name="dialog-error-symbolic", icon_size=Gtk.IconSize.LARGE)
         self.error_box.append(error_icon)
 
-        self.error_label = Gtk.Label()
-        self.error_label.add_css_class("error")
-        self.error_label.set_wrap(True)
+        self.error_label = Gtk.Label(wrap=True, css_classes=["error"])
         self.error_box.append(self.error_label)
 
         main_box.append(self.error_box)
 
-        # Spacer
-        spacer = Gtk.Box()
-        spacer.set_vexpand(True)
-        main_box.append(spacer)
-
-        # Buttons
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-        button_box.set_halign(Gtk.Align.CENTER)
+        # Buttons, expanded to the bottom of the dialog instead of using a spacer
+        button_box = Gtk.Box(
+            orientation=Gtk.Orientation.HORIZONTAL, spacing=8,
+            halign=Gtk.Align.CENTER, vexpand=True, valign=Gtk.Align.END
+        )
 
-        self.start_btn = Gtk.Button(label="Start")
-        self.start_btn.add_css_class("suggested-action")
-        self.start_btn.add_css_class("pill")
+        self.start_btn = Gtk.Button(label="Start", css_classes=["suggested-action", "pill"])
         self.start_btn.connect("clicked", self._on_start_clicked)
         button_box.append(self.start_btn)
 
-        self.stop_btn = Gtk.Button(label="Stop")
-        self.stop_btn.add_css_class("destructive-action")
-        self.stop_btn.add_css_class("pill")
-        self.stop_btn.set_sensitive(False)
+        self.stop_btn = Gtk.Button(
+            label="Stop", sensitive=False, css_classes=["destructive-action", "pill"]
+        )
         self.stop_btn.connect("clicked", self._on_stop_clicked)
         button_box.append(self.stop_btn)
 
-        self.close_btn = Gtk.Button(label="Close")
-        self.close_btn.add_css_class("pill")
+        self.close_btn = Gtk.Button(label="Close", css_classes=["pill"])
         self.close_btn.connect("clicked", lambda b: self.close())
         button_box.append(self.close_btn)
 
@@ -521,6 +607,7 @@ class BatchWriteDialog(Adw.Window):
         self.is_running = True
         self.has_error = False
         self.error_box.set_visible(False)
+        self.status_label.remove_css_class("error")
         self.start_btn.set_sensitive(False)
         self.stop_btn.set_sensitive(True)
         self.close_btn.set_sensitive(False)
@@ -547,6 +634,7 @@ class BatchWriteDialog(Adw.Window):
 
         if self.has_error:
             self.status_label.set_text(f"Stopped due to error after {self.cards_written} cards")
+            self.status_label.add_css_class("error")
         else:
             self.status_label.set_text(f"Stopped. {self.cards_written} cards written.")
 
@@ -560,19 +648,7 @@ class BatchWriteDialog(Adw.Window):
         def do_write():
             # Write card
             if self.format_id == "raw":
-                try:
-                    t1 = bytes.fromhex(self.track1) if self.track1 else None
-                    t2 = bytes.fromhex(self.track2) if self.track2 else None
-                    t3 = bytes.fromhex(self.track3) if self.track3 else None
-                    result = self.commands.write_raw(t1, t2, t3, timeout_ms=30000)
-                except ValueError as e:
-                    from ..msr605x.commands import CommandResult
-                    from ..msr605x.constants import ErrorCode
-                    result = CommandResult(
-                        success=False,
-                        error_code=ErrorCode.COMMAND_FORMAT_ERROR,
-                        message=f"Invalid hex: {e}"
-                    )
+                result = self.commands.write_raw(*self._raw_tracks, timeout_ms=30000)
             else:
                 result = self.commands.write_iso(self.track1, self.track2, self.track3, timeout_ms=30000)
 
@@ -581,7 +657,7 @@ class BatchWriteDialog(Adw.Window):
                 return
 
             # Verify by reading back
-            GLib.idle_add(lambda: self.status_label.set_text("Verifying... swipe again"))
+            GLib.idle_add(self._set_status, "Verifying... swipe again")
 
             verify_result = self.commands.compare_card(self.track1, self.track2, self.track3, timeout_ms=30000)
 
@@ -590,13 +666,22 @@ class BatchWriteDialog(Adw.Window):
             else:
                 GLib.idle_add(self._on_write_error, f"Verify failed: {verify_result.message}")
 
-        thread = Thread(target=do_write, daemon=True)
-        thread.start()
+        self._future = IO_POOL.submit(do_write)
+
+    def _on_destroy(self, widget):
+        """Drop a card write that hasn't started when the dialog goes away."""
+        if self._future is not None:
+            self._future.cancel()
+
+    def _set_status(self, text: str):
+        """Set the status label from an idle callback."""
+        self.status_label.set_text(text)
+        return GLib.SOURCE_REMOVE
 
     def _on_card_success(self):
         """Handle successful write+verify."""
         self.cards_written += 1
-        self.counter_label.set_markup(f"<span size='xx-large' weight='bold'>{self.cards_written}</span>")
+        self.counter_label.set_text(str(self.cards_written))
         self.status_label.set_text("Card written successfully! Swipe next card...")
 
         if self.is_running:
@@ -5,15 +5,40 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GLib, Gio
+from gi.repository import Gtk, Adw, GLib
 from typing import Optional
-from threading import Thread
+import time
 
 from .msr605x import MSR605XDevice, MSR605XCommands
 from .msr605x.constants import Coercivity, ErrorCode
 from .ui import ReadPanel, WritePanel, ErasePanel, SettingsPanel
+from .ui.io_pool import IO_POOL
 from .utils.file_io import FileManager
 
+# GUdev is optional, without it device hotplug falls back to polling
+try:
+    gi.require_version('GUdev', '1.0')
+    from gi.repository import GUdev
+except (ValueError, ImportError):
+    GUdev = None
+
+# Number of lines kept in the activity log
+LOG_MAX_LINES = 500
+
+# Minimum time between automatic connect attempts, in microseconds
+CONNECT_RETRY_US = 1_000_000
+
+# Sidebar navigation buttons: label, icon and stack page
+NAV_PAGES = (
+    ("Read Card", "document-open-symbolic", "read"),
+    ("Write Card", "document-save-symbolic", "write"),
+    ("Erase Card", "edit-clear-symbolic", "erase"),
+    ("Settings", "preferences-system-symbolic", "settings"),
+)
+
+# Identical toasts within this many microseconds are shown only once
+TOAST_DEDUP_US = 500_000
+
 
 class MSR605XWindow(Adw.ApplicationWindow):
     """Main application window."""
@@ -25,6 +50,18 @@ class MSR605XWindow(Adw.ApplicationWindow):
         self.device = MSR605XDevice()
         self.commands = MSR605XCommands(self.device)
         self.file_manager = FileManager()
+        self.connect("destroy", self._on_destroy)
+
+        # LED state currently shown, LEDs start off
+        self._led_state = {"green": False, "yellow": False, "red": False}
+        # Monotonic time each toast message was last shown, pruned periodically
+        self._recent_toasts: dict[str, int] = {}
+        self._prune_source_id = GLib.timeout_add_seconds(30, self._prune_toasts)
+
+        # Connection state the UI currently shows (None until first applied)
+        self._last_connected_applied: Optional[bool] = None
+        # Whether a connection state update is already queued on the main loop
+        self._state_update_pending = False
 
         # Set callback for status changes
         self.device.set_status_callback(self._on_device_status_changed)
@@ -72,39 +109,40 @@ class MSR605XWindow(Adw.ApplicationWindow):
         self.header.set_title_widget(title)
         self.title_widget = title
 
-        # Left side - LED indicators only (auto-connection)
+        # Left side - LED indicators only (auto-connection), plain boxes drawn
+        # entirely by CSS
         led_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
         led_box.set_margin_start(6)
 
-        self.led_green = Gtk.DrawingArea()
+        self.led_green = Gtk.Box()
         self.led_green.set_size_request(12, 12)
         self.led_green.add_css_class("led-indicator")
         self.led_green.add_css_class("led-off")
         led_box.append(self.led_green)
 
-        self.led_yellow = Gtk.DrawingArea()
+        self.led_yellow = Gtk.Box()
         self.led_yellow.set_size_request(12, 12)
         self.led_yellow.add_css_class("led-indicator")
         self.led_yellow.add_css_class("led-off")
         led_box.append(self.led_yellow)
 
-        self.led_red = Gtk.DrawingArea()
+        self.led_red = Gtk.Box()
         self.led_red.set_size_request(12, 12)
         self.led_red.add_css_class("led-indicator")
         self.led_red.add_css_class("led-off")
         led_box.append(self.led_red)
 
         self.header.pack_start(led_box)
+        self._led_widgets = {
+            "green": self.led_green,
+            "yellow": self.led_yellow,
+            "red": self.led_red,
+        }
 
         # Right side - Menu
         menu_button = Gtk.MenuButton()
         menu_button.set_icon_name("open-menu-symbolic")
-
-        menu = Gio.Menu()
-        menu.append("Preferences", "app.preferences")
-        menu.append("About", "app.about")
-        menu.append("Quit", "app.quit")
-        menu_button.set_menu_model(menu)
+        menu_button.set_menu_model(self.get_application().main_menu)
 
         self.header.pack_end(menu_button)
 
@@ -126,59 +164,41 @@ class MSR605XWindow(Adw.ApplicationWindow):
         self.stack.set_hexpand(True)
         self.stack.set_vexpand(True)
 
-        # Create panels
+        # Create panels, Erase and Settings are built on first visit into the
+        # empty pages standing in for them
         self.read_panel = ReadPanel(self.commands, self._show_toast, self.file_manager)
         self.write_panel = WritePanel(self.commands, self._show_toast, self.file_manager)
-        self.erase_panel = ErasePanel(self.commands, self._show_toast)
-        self.settings_panel = SettingsPanel(self.commands, self._show_toast)
+        self.erase_panel: Optional[ErasePanel] = None
+        self.settings_panel: Optional[SettingsPanel] = None
+        self._panel_factories = {
+            "erase": lambda: ErasePanel(self.commands, self._show_toast),
+            "settings": lambda: SettingsPanel(self.commands, self._show_toast),
+        }
 
         self.stack.add_titled(self.read_panel, "read", "Read")
         self.stack.add_titled(self.write_panel, "write", "Write")
-        self.stack.add_titled(self.erase_panel, "erase", "Erase")
-        self.stack.add_titled(self.settings_panel, "settings", "Settings")
+        self.stack.add_titled(Gtk.Box(), "erase", "Erase")
+        self.stack.add_titled(Gtk.Box(), "settings", "Settings")
 
         self.content_box.append(self.stack)
 
     def _build_sidebar(self) -> Gtk.Box:
         """Build navigation sidebar."""
-        sidebar = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
-        sidebar.set_margin_top(12)
-        sidebar.set_margin_bottom(12)
-        sidebar.set_margin_start(12)
-        sidebar.set_margin_end(12)
-        sidebar.set_size_request(200, -1)
-
-        # Navigation buttons
-        nav_buttons = [
-            ("Read Card", "document-open-symbolic", "read"),
-            ("Write Card", "document-save-symbolic", "write"),
-            ("Erase Card", "edit-clear-symbolic", "erase"),
-            ("Settings", "preferences-system-symbolic", "settings"),
-        ]
+        sidebar = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, width_request=200)
+        sidebar.add_css_class("panel-padded-12")
 
         self.nav_button_group = []
-        first = True
-
-        for label, icon, page in nav_buttons:
-            btn = Gtk.ToggleButton()
-            btn_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
-            btn_box.set_margin_start(8)
-            btn_box.set_margin_end(8)
+        first_btn = None
 
-            icon_widget = Gtk.Image.new_from_icon_name(icon)
-            btn_box.append(icon_widget)
+        for label, icon, page in NAV_PAGES:
+            btn_box = Gtk.Box(spacing=8, margin_start=8, margin_end=8)
+            btn_box.append(Gtk.Image(icon_name=icon))
+            btn_box.append(Gtk.Label(label=label, xalign=0, hexpand=True))
 
-            label_widget = Gtk.Label(label=label)
-            label_widget.set_xalign(0)
-            label_widget.set_hexpand(True)
-            btn_box.append(label_widget)
-
-            btn.set_child(btn_box)
+            # Group the buttons so GTK keeps exactly one active
+            btn = Gtk.ToggleButton(child=btn_box, active=first_btn is None, group=first_btn)
             btn.page_name = page
-
-            if first:
-                btn.set_active(True)
-                first = False
+            first_btn = first_btn or btn
 
             btn.connect("toggled", self._on_nav_toggled)
 
@@ -205,6 +225,16 @@ class MSR605XWindow(Adw.ApplicationWindow):
         self.log_view.set_wrap_mode(Gtk.WrapMode.WORD)
         self.log_view.add_css_class("log-view")
         self.log_buffer = self.log_view.get_buffer()
+        # Persistent mark at the end of the log, kept there by right gravity
+        self._log_end_mark = self.log_buffer.create_mark(
+            "log-end", self.log_buffer.get_end_iter(), False
+        )
+        # Lines waiting to be added by the next log flush
+        self._log_queue: list[str] = []
+        self._log_flush_pending = False
+        # Timestamp of the last logged second, reformatted only when it changes
+        self._last_log_sec = -1
+        self._last_log_ts = ""
 
         log_scroll.set_child(self.log_view)
         sidebar.append(log_scroll)
@@ -213,28 +243,31 @@ class MSR605XWindow(Adw.ApplicationWindow):
 
     def _on_nav_toggled(self, button):
         """Handle navigation button toggle."""
-        if button.get_active():
-            # Deactivate other buttons
-            for btn in self.nav_button_group:
-                if btn != button:
-                    btn.set_active(False)
-
-            # If switching to write panel, copy read data
-            if button.page_name == "write" and self.read_panel.current_tracks:
-                track1 = ""
-                track2 = ""
-                track3 = ""
-                for track in self.read_panel.current_tracks:
-                    if track.track_number == 1:
-                        track1 = track.data
-                    elif track.track_number == 2:
-                        track2 = track.data
-                    elif track.track_number == 3:
-                        track3 = track.data
-                self.write_panel.set_track_data(track1, track2, track3)
-
-            # Switch to selected page
-            self.stack.set_visible_child_name(button.page_name)
+        # The button deactivated by the group also emits toggled
+        if not button.get_active():
+            return
+
+        # If switching to write panel, copy read data
+        tracks = self.read_panel.current_tracks_by_number
+        if button.page_name == "write" and tracks:
+            self.write_panel.set_track_data(tracks.get(1, ""), tracks.get(2, ""), tracks.get(3, ""))
+
+        # Switch to selected page
+        self._ensure_panel(button.page_name)
+        self.stack.set_visible_child_name(button.page_name)
+
+    def _ensure_panel(self, page: str):
+        """Build a lazily created panel the first time its page is shown."""
+        factory = self._panel_factories.pop(page, None)
+        if factory is None:
+            return
+
+        # Fill the placeholder page rather than replacing it, so the stack
+        # keeps its order and slide transitions their direction
+        panel = factory()
+        panel.set_hexpand(True)
+        self.stack.get_child_by_name(page).append(panel)
+        setattr(self, f"{page}_panel", panel)
 
     def _connect(self):
         """Connect to MSR605X device (automatic)."""
@@ -242,84 +275,152 @@ class MSR605XWindow(Adw.ApplicationWindow):
 
         def do_connect():
             success, message = self.device.connect()
-            GLib.idle_add(self._on_connect_complete, success, message)
-
-        thread = Thread(target=do_connect, daemon=True)
-        thread.start()
+            fw_result = None
+            if success:
+                # Reset device to clean state and get firmware version here
+                # rather than on the main loop, each is a USB round trip
+                self.commands.reset()
+                fw_result = self.commands.get_firmware_version()
+            GLib.idle_add(self._on_connect_complete, success, message, fw_result)
+
+        IO_POOL.submit(do_connect)
+
+    def _on_destroy(self, widget):
+        """Stop device checks and release the worker thread."""
+        # Remove every source that could submit to the I/O worker once it is shut down
+        for source_id in (self._prune_source_id, self._polling_source_id, self._recheck_source_id):
+            if source_id:
+                GLib.source_remove(source_id)
+        self._prune_source_id = self._polling_source_id = self._recheck_source_id = 0
+        if self._udev is not None:
+            self._udev.disconnect(self._udev_handler_id)
+            self._udev = None
+
+        # The window owns the device, so its I/O worker goes with it
+        IO_POOL.shutdown(wait=False, cancel_futures=True)
 
     def _disconnect(self):
-        """Disconnect from MSR605X device."""
-        success, message = self.device.disconnect()
+        """Disconnect from MSR605X device without blocking the main loop."""
+        self._disconnecting = True
+
+        def do_disconnect():
+            success, message = self.device.disconnect()
+            GLib.idle_add(self._on_disconnect_complete, success)
+
+        # Runs after any connect already queued on the worker
+        IO_POOL.submit(do_disconnect)
+
+    def _on_disconnect_complete(self, success: bool):
+        """Handle disconnect result."""
+        self._disconnecting = False
 
         if success:
             self._log("Device disconnected")
 
         self._update_connection_state()
 
+        # Handle hotplug events that were skipped while disconnecting
+        self._check_device_connection()
+
     def _update_connection_state(self):
-        """Update UI based on connection state."""
+        """Update UI based on connection state, skipped when it hasn't changed."""
         connected = self.device.is_connected
+        if connected == self._last_connected_applied:
+            return
+        self._last_connected_applied = connected
 
-        if connected:
-            self.title_widget.set_subtitle("Connected")
-            # Update LED indicators
-            self._set_led("green", True)
-            self._set_led("yellow", False)
-            self._set_led("red", False)
-        else:
-            self.title_widget.set_subtitle("Searching for device...")
-            # All LEDs off
-            self._set_led("green", False)
-            self._set_led("yellow", False)
-            self._set_led("red", False)
+        self.title_widget.set_subtitle("Connected" if connected else "Searching for device...")
 
-        # Update panels
-        self.read_panel.set_sensitive(connected)
-        self.write_panel.set_sensitive(connected)
-        self.erase_panel.set_sensitive(connected)
-        self.settings_panel.set_sensitive(connected)
+        # Update LED indicators, green shows the connection, the others are off
+        for color, on in (("green", connected), ("yellow", False), ("red", False)):
+            self._set_led(color, on)
+
+        # Update panels through the stack that holds them all, including
+        # panels built later
+        self.stack.set_sensitive(connected)
 
     def _set_led(self, color: str, on: bool):
         """Set LED indicator state."""
-        led_widgets = {
-            "green": self.led_green,
-            "yellow": self.led_yellow,
-            "red": self.led_red,
-        }
-
-        led = led_widgets.get(color)
-        if led:
-            led.remove_css_class("led-off")
-            led.remove_css_class(f"led-{color}")
-
+        led = self._led_widgets.get(color)
+        if led and self._led_state[color] != on:
+            # Swap a single class, only when the state actually changes
             if on:
+                led.remove_css_class("led-off")
                 led.add_css_class(f"led-{color}")
             else:
+                led.remove_css_class(f"led-{color}")
                 led.add_css_class("led-off")
+            self._led_state[color] = on
 
     def _on_device_status_changed(self, connected: bool):
         """Callback for device connection status changes."""
-        GLib.idle_add(self._update_connection_state)
+        # Coalesce bursts of status changes into one update on the main loop
+        if not self._state_update_pending:
+            self._state_update_pending = True
+            GLib.idle_add(self._apply_connection_state)
+
+    def _apply_connection_state(self):
+        """Apply a queued connection state update."""
+        self._state_update_pending = False
+        self._update_connection_state()
+        # A dropped connection with the device still present (a read error)
+        # brings no hotplug event, so check for it here
+        if not self.device.is_connected:
+            self._check_device_connection()
+        return GLib.SOURCE_REMOVE
 
     def _show_toast(self, message: str, error: bool = False):
-        """Show a toast notification."""
+        """Show a toast notification, dropping repeats of a recent one."""
+        now = GLib.get_monotonic_time()
+        if now - self._recent_toasts.get(message, -TOAST_DEDUP_US) < TOAST_DEDUP_US:
+            return
+        self._recent_toasts[message] = now
+
         toast = Adw.Toast(title=message)
         if error:
             toast.set_timeout(5)
         self.toast_overlay.add_toast(toast)
 
+    def _prune_toasts(self) -> bool:
+        """Forget toasts shown longer ago than the dedup window."""
+        cutoff = GLib.get_monotonic_time() - TOAST_DEDUP_US
+        self._recent_toasts = {
+            message: shown for message, shown in self._recent_toasts.items() if shown >= cutoff
+        }
+        return GLib.SOURCE_CONTINUE
+
     def _log(self, message: str):
         """Add message to activity log."""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        text = f"[{timestamp}] {message}\n"
-
-        end_iter = self.log_buffer.get_end_iter()
-        self.log_buffer.insert(end_iter, text)
+        sec = GLib.get_real_time() // 1_000_000
+        if sec != self._last_log_sec:
+            self._last_log_sec = sec
+            self._last_log_ts = time.strftime("%H:%M:%S", time.localtime(sec))
+        self._log_queue.append(f"[{self._last_log_ts}] {message}\n")
+
+        # Batch lines logged in a burst into one buffer update
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            GLib.idle_add(self._flush_log)
+
+    def _flush_log(self):
+        """Add queued lines to the activity log, keeping only the newest lines."""
+        self._log_flush_pending = False
+        text = "".join(self._log_queue)
+        self._log_queue.clear()
+
+        buffer = self.log_buffer
+        buffer.insert(buffer.get_end_iter(), text)
+
+        # Drop the oldest lines beyond the limit (the last line is the empty one
+        # after the final newline)
+        excess = buffer.get_line_count() - 1 - LOG_MAX_LINES
+        if excess > 0:
+            _, cut = buffer.get_iter_at_line(excess)
+            buffer.delete(buffer.get_start_iter(), cut)
 
         # Scroll to bottom
-        mark = self.log_buffer.create_mark(None, self.log_buffer.get_end_iter(), False)
-        self.log_view.scroll_to_mark(mark, 0, False, 0, 0)
+        self.log_view.scroll_mark_onscreen(self._log_end_mark)
+        return GLib.SOURCE_REMOVE
 
     def show_settings(self):
         """Show settings panel."""
@@ -329,47 +430,91 @@ class MSR605XWindow(Adw.ApplicationWindow):
                 break
 
     def _start_device_polling(self):
-        """Start polling for device connection."""
-        self._polling_source_id = GLib.timeout_add(1000, self._check_device_connection)
+        """Start watching for device connection, by hotplug events when available."""
         self._connecting = False
+        self._disconnecting = False
+        # Monotonic time of the last connect attempt, so clock jumps on
+        # suspend/resume or NTP adjustment can't skip or repeat a retry
+        self._last_connect_attempt = -CONNECT_RETRY_US
+        self._recheck_source_id = 0
+        self._polling_source_id = 0
+        self._udev = None
+
+        if GUdev is not None:
+            # hidraw nodes are what hidapi opens, so their events mark the
+            # moments the device becomes usable or goes away
+            self._udev = GUdev.Client.new(["hidraw"])
+            self._udev_handler_id = self._udev.connect("uevent", self._on_uevent)
+            # Catch a device that is already plugged in
+            self._check_device_connection()
+        else:
+            self._polling_source_id = GLib.timeout_add(1000, self._check_device_connection)
+
+    def _on_uevent(self, client, action: str, device):
+        """Re-check the device when a hidraw node is added or removed."""
+        if action in ("add", "remove"):
+            self._check_device_connection()
 
     def _check_device_connection(self) -> bool:
         """Check if device is available and auto-connect/disconnect."""
-        devices = self.device.enumerate_devices()
+        # Wait for a disconnect in progress to finish before checking again
+        if self._disconnecting:
+            return True
+
+        available = self.device.first_device() is not None
 
         if self.device.is_connected:
             # Check if device was unplugged
-            if not devices:
+            if not available:
                 self._log("Device unplugged")
                 self._disconnect()
         else:
             # Check if device is available and try to connect
-            if devices and not self._connecting:
+            if available and not self._connecting:
+                wait_us = self._last_connect_attempt + CONNECT_RETRY_US - GLib.get_monotonic_time()
+                if wait_us > 0:
+                    # Too soon after the last attempt, hotplug events don't
+                    # repeat so check again once the interval has passed
+                    self._schedule_recheck(wait_us // 1000 + 1)
+                    return True
+                self._last_connect_attempt = GLib.get_monotonic_time()
                 self._connecting = True
                 self._log("Device detected, connecting...")
                 self._connect()
-            elif not devices:
+            elif not available:
                 self._connecting = False
 
         return True  # Continue polling
 
-    def _on_connect_complete(self, success: bool, message: str):
-        """Handle connection result."""
+    def _schedule_recheck(self, delay_ms: int):
+        """Check the device again later when watching hotplug events, unless already scheduled."""
+        # Polling retries on its own
+        if self._udev is not None and not self._recheck_source_id:
+            self._recheck_source_id = GLib.timeout_add(delay_ms, self._recheck_device)
+
+    def _recheck_device(self):
+        """Run a device check deferred by the connect retry interval."""
+        self._recheck_source_id = 0
+        self._check_device_connection()
+        return GLib.SOURCE_REMOVE
+
+    def _on_connect_complete(self, success: bool, message: str, fw_result=None):
+        """Handle connection result, with the firmware query made after connecting."""
         self._connecting = False
 
         if success:
             self._show_toast("Device connected")
             self._log(f"Connected: {message}")
 
-            # Reset device to clean state
-            self.commands.reset()
-
-            # Get firmware version
-            fw_result = self.commands.get_firmware_version()
-            if fw_result.success:
+            if fw_result is not None and fw_result.success:
                 self._log(fw_result.message)
 
         else:
             self._log(f"Connection failed: {message}")
+            # State is unchanged, so the update below keeps the "Connecting..." subtitle
+            self.title_widget.set_subtitle("Searching for device...")
+            # Hotplug events only come on replug, so retry while the device
+            # is still enumerated
+            self._schedule_recheck(CONNECT_RETRY_US // 1000)
 
         self._update_connection_state()
@@ -0,0 +1,208 @@
+"""Tests for high-level command interface."""
+
+from src.msr605x.commands import MSR605XCommands
+from src.msr605x.constants import (
+    BPC,
+    BPI,
+    Coercivity,
+    Command,
+    ErrorCode,
+    TrackNumber,
+    error_message,
+)
+
+
+class FakeDevice:
+    """Minimal stand-in for MSR605XDevice recording sent commands."""
+
+    def __init__(self, responses=None):
+        self.is_connected = True
+        self.sent = []
+        self.responses = list(responses or [])
+
+    def flush(self):
+        pass
+
+    def send_command(self, command, data=b''):
+        self.sent.append(command + data)
+        return True, b''
+
+    def receive_response(self, timeout_ms=5000):
+        if self.responses:
+            return True, self.responses.pop(0)
+        return False, b''
+
+    def has_response(self):
+        return bool(self.responses)
+
+    def send_and_receive(self, command, data=b'', timeout_ms=5000):
+        self.send_command(command, data)
+        return self.receive_response(timeout_ms)
+
+
+class TestMSR605XCommands:
+    """Tests for MSR605XCommands class."""
+
+    def test_firmware_version_cached(self):
+        """Test firmware version is only queried once."""
+        device = FakeDevice(responses=[b'REVT3.15'])
+        commands = MSR605XCommands(device)
+
+        first = commands.get_firmware_version()
+        second = commands.get_firmware_version()
+
+        assert first.success is True
+        assert second is first
+        assert commands.firmware_version == "REVT3.15"
+        assert device.sent.count(Command.GET_FIRMWARE.value) == 1
+
+    def test_firmware_cache_cleared_on_reset(self):
+        """Test reset invalidates the cached firmware version."""
+        device = FakeDevice(responses=[b'REVT3.15'])
+        commands = MSR605XCommands(device)
+        commands.get_firmware_version()
+
+        commands.reset()
+        result = commands.get_firmware_version()
+
+        assert result.success is False
+        assert result.error_code == ErrorCode.COMMUNICATION_ERROR
+        assert commands.firmware_version is None
+
+    def test_parse_status(self):
+        """Test status classification of device responses."""
+        commands = MSR605XCommands(FakeDevice())
+
+        assert commands._parse_status(b'') == (False, ErrorCode.COMMUNICATION_ERROR)
+        assert commands._parse_status(b'\x1b') == (False, ErrorCode.UNKNOWN_ERROR)
+        assert commands._parse_status(b'\x1b0') == (True, ErrorCode.SUCCESS)
+        assert commands._parse_status(b'\x1bs\x1b\x01DATA') == (True, ErrorCode.SUCCESS)
+
+    def test_write_sends_coercivity_once(self):
+        """Test coercivity is only sent before the first of several writes."""
+        device = FakeDevice(responses=[b'\x1b0'] * 3)
+        commands = MSR605XCommands(device)
+
+        commands.write_iso(track2="1234")
+        commands.write_iso(track2="5678")
+
+        assert device.sent.count(Command.SET_HICO.value) == 1
+
+    def test_set_coercivity_skips_resend_on_write(self):
+        """Test a confirmed coercivity change is not re-sent on write."""
+        device = FakeDevice(responses=[b'\x1b0', b'\x1b0'])
+        commands = MSR605XCommands(device)
+
+        commands.set_coercivity(Coercivity.LOW)
+        commands.write_iso(track2="1234")
+
+        assert device.sent[0] == Command.SET_LOCO.value
+        assert Command.SET_LOCO.value not in device.sent[1:]
+
+    def test_reset_resends_coercivity(self):
+        """Test reset forces coercivity to be sent again before a write."""
+        device = FakeDevice(responses=[b'\x1b0'] * 4)
+        commands = MSR605XCommands(device)
+
+        commands.write_iso(track2="1234")
+        commands.reset()
+        commands.write_iso(track2="5678")
+
+        assert device.sent.count(Command.SET_HICO.value) == 2
+
+    def test_erase_track_mask(self):
+        """Test erase sends the selected tracks as a binary mask."""
+        device = FakeDevice(responses=[b'\x1b0'] * 3)
+        commands = MSR605XCommands(device)
+
+        commands.erase(track1=True, track2=False, track3=True)
+        commands.erase(track1=False, track2=True, track3=False)
+
+        assert device.sent[-2] == Command.ERASE_CARD.value + b'\x05'
+        assert device.sent[-1] == Command.ERASE_CARD.value + b'\x02'
+
+    def test_normalize_track_data(self):
+        """Test sentinels are added only when missing."""
+        commands = MSR605XCommands(FakeDevice())
+
+        assert commands._normalize_track_data("b1234^doe", 1) == "%B1234^DOE?"
+        assert commands._normalize_track_data("%B1234?", 1) == "%B1234?"
+        assert commands._normalize_track_data("1234=25", 2) == ";1234=25?"
+        assert commands._normalize_track_data(";1234?", 3) == ";1234?"
+        assert commands._normalize_track_data("", 2) == ""
+
+    def test_get_coercivity(self):
+        """Test coercivity is parsed from the first 0/1 byte."""
+        device = FakeDevice(responses=[b'\x1b0\x00', b'\x1b0'])
+        commands = MSR605XCommands(device)
+
+        result = commands.get_coercivity()
+
+        assert result.success is True
+        assert "Lo-Co" in result.message
+        assert commands.get_coercivity().success is False
+
+    def test_compare_card(self):
+        """Test compare reports only tracks that differ from expected data."""
+        response = b'\x1bs\x1b\x01%B1234^DOE?\x1b\x02;1234=25?\x1b\x03?\x1c\x1b0'
+        device = FakeDevice(responses=[response])
+        commands = MSR605XCommands(device)
+
+        result = commands.compare_card(track1="B1234^DOE", track2="9999=25")
+
+        assert result.success is False
+        assert result.message == "Mismatch on: Track 2"
+
+    def test_start_and_finish_compare(self):
+        """Test a compare split around a nonblocking response check."""
+        response = b'\x1bs\x1b\x01%B1234^DOE?\x1b\x02;1234=25?\x1b\x03?\x1c\x1b0'
+        device = FakeDevice()
+        commands = MSR605XCommands(device)
+
+        assert commands.start_compare() is True
+        assert device.sent == [Command.READ_ISO.value]
+        assert commands.response_pending() is False
+
+        device.responses.append(response)
+        assert commands.response_pending() is True
+
+        result = commands.finish_compare(track1="B1234^DOE", track2="1234=25")
+        assert result.success is True
+        assert result.message == "All tracks match"
+
+    def test_finish_compare_without_response(self):
+        """Test finishing a compare with no swipe reports a failed read."""
+        commands = MSR605XCommands(FakeDevice())
+
+        result = commands.finish_compare(track2="1234=25")
+
+        assert result.success is False
+        assert result.error_code == ErrorCode.INVALID_CARD_SWIPE
+
+    def test_set_bpi_and_bpc_payloads(self):
+        """Test BPI/BPC settings are encoded as track + value bytes."""
+        device = FakeDevice(responses=[b'\x1b0', b'\x1b0'])
+        commands = MSR605XCommands(device)
+
+        commands.set_bpi(TrackNumber.TRACK_2, BPI.BPI_210)
+        commands.set_bpc(TrackNumber.TRACK_3, BPC.BPC_5)
+
+        assert device.sent == [
+            Command.SET_BPI.value + b'\x02\x01',
+            Command.SET_BPC.value + b'\x03\x05',
+        ]
+
+
+class TestErrorMessage:
+    """Tests for error_message lookup."""
+
+    def test_known_code(self):
+        """Test known codes resolve to their message."""
+        assert error_message(ErrorCode.DEVICE_BUSY) == "Device is busy"
+        assert error_message(99) == "Unknown error occurred"
+
+    def test_unknown_code_uses_default(self):
+        """Test codes without a message fall back to the default."""
+        assert error_message(42, "Read failed") == "Read failed"
+        assert error_message(-1, "Read failed") == "Read failed"
+        assert error_message(1000) == "Unknown error occurred"
@@ -0,0 +1,128 @@
+"""Tests for low-level device packet handling."""
+
+import time
+
+from src.msr605x.device import MSR605XDevice
+
+
+def make_packet(payload: bytes, first: bool = True, last: bool = True) -> bytes:
+    """Build a 64-byte HID report with MSR605X header."""
+    header = len(payload) | (0x80 if first else 0) | (0x40 if last else 0)
+    return bytes([header]) + payload + bytes(63 - len(payload))
+
+
+class FakeHidDevice:
+    """Stand-in for hid.device returning canned reports."""
+
+    def __init__(self, reports=None):
+        self.reports = list(reports or [])
+        self.written = []
+
+    def read(self, max_length, timeout_ms=0):
+        if self.reports:
+            return list(self.reports.pop(0))
+        time.sleep(timeout_ms / 1000)
+        return []
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        return len(data)
+
+
+class FailingHidDevice:
+    """Stand-in for hid.device whose reads fail."""
+
+    def read(self, max_length, timeout_ms=0):
+        raise OSError("read error")
+
+
+class TestMSR605XDevice:
+    """Tests for MSR605XDevice class."""
+
+    def setup_method(self):
+        """Setup a device that looks connected without real hardware."""
+        self.device = MSR605XDevice()
+        self.device._device = object()
+        self.device._connected = True
+
+    def test_build_packets_single(self):
+        """Test a short payload fits in one first+last packet."""
+        packets = self.device._build_packets(b'\x1be')
+
+        assert packets == [make_packet(b'\x1be')]
+
+    def test_build_packets_multi(self):
+        """Test payloads over 63 bytes are split with header flags."""
+        payload = bytes(range(100))
+        packets = self.device._build_packets(payload)
+
+        assert len(packets) == 2
+        assert all(len(packet) == 64 for packet in packets)
+        assert packets[0][0] == 0x80 | 63
+        assert packets[1][0] == 0x40 | 37
+        assert packets[0][1:] + packets[1][1:38] == payload
+
+    def test_receive_response_assembles_packets(self):
+        """Test queued packets are joined until the last packet flag."""
+        self.device._rx_queue.put(make_packet(b'\x1bs\x1b\x01', last=False))
+        self.device._rx_queue.put(make_packet(b'DATA\x1b0', first=False))
+
+        success, response = self.device.receive_response(100)
+
+        assert success is True
+        assert response == b'\x1bs\x1b\x01DATA\x1b0'
+
+    def test_receive_response_timeout(self):
+        """Test an empty queue times out with no data."""
+        assert self.device.receive_response(10) == (False, b'')
+
+    def test_flush_discards_queued_reports(self):
+        """Test flush empties the receive queue."""
+        self.device._rx_queue.put(make_packet(b'\x1b0'))
+        self.device.flush()
+
+        assert self.device._rx_queue.empty()
+
+    def test_reader_thread_feeds_receive(self):
+        """Test reports read by the reader thread reach receive_response."""
+        self.device._device = FakeHidDevice([make_packet(b'\x1b0')])
+        self.device._start_reader()
+        try:
+            success, response = self.device.send_and_receive(b'\x1be', timeout_ms=1000)
+        finally:
+            self.device._stop_reader()
+
+        assert success is True
+        assert response == b'\x1b0'
+        assert self.device._device.written == [make_packet(b'\x1be')]
+
+    def test_reader_error_disconnects(self):
+        """Test a read error marks the device disconnected and wakes receivers."""
+        statuses = []
+        self.device.set_status_callback(statuses.append)
+        self.device._device = FailingHidDevice()
+        self.device._start_reader()
+        self.device._reader.join(timeout=1.0)
+
+        assert self.device.is_connected is False
+        assert statuses == [False]
+        assert self.device.receive_response(5000) == (False, b'')
+
+    def test_has_response(self):
+        """Test has_response reports queued reports without consuming them."""
+        assert self.device.has_response() is False
+
+        self.device._rx_queue.put(make_packet(b'\x1b0'))
+
+        assert self.device.has_response() is True
+        assert self.device.receive_response(100) == (True, b'\x1b0')
+
+    def test_cancel_receive(self):
+        """Test cancel_receive ends a pending receive without data."""
+        self.device.cancel_receive()
+
+        start = time.monotonic()
+        result = self.device.receive_response(5000)
+
+        assert result == (False, b'')
+        assert time.monotonic() - start < 1
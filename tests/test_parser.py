@@ -37,6 +37,16 @@ class TestTrackParser:
         assert b'\x1b\x02' in data
         assert b'4111111111111111' in data
 
+    def test_build_iso_write_data_strips_sentinels(self):
+        """Test sentinels included by the user are removed."""
+        data = self.parser.build_iso_write_data(
+            track1="%b1234^doe?",
+            track2=";1234=25?",
+            track3="0123"
+        )
+
+        assert data == b'\x1bs\x1b\x01B1234^DOE\x1b\x021234=25\x1b\x030123?\x1c'
+
     def test_build_raw_write_data(self):
         """Test building raw write data."""
         data = self.parser.build_raw_write_data(
@@ -49,6 +59,7 @@ class TestTrackParser:
         assert b'\x1a\x2b\x3c' in data
         assert b'\x1b\x03' in data
         assert b'\x4d\x5e\x6f' in data
+        assert b'\x1b\x02\x00' in data
 
     def test_clean_track_data(self):
         """Test cleaning track data."""
@@ -65,6 +76,17 @@ class TestTrackParser:
         valid_data = "%B4111111111111111^DOE/JOHN^2512?"
         assert self.parser._validate_track_data(valid_data, 1) is True
 
+    def test_validate_track2_data(self):
+        """Test validation of track 2 data."""
+        assert self.parser._validate_track_data(";4111111111111111=2512?", 2) is True
+        assert self.parser._validate_track_data("%4111?", 2) is True
+        assert self.parser._validate_track_data(";4111A?", 2) is False
+
+    def test_validate_track1_rejects_lowercase(self):
+        """Test track 1 rejects characters outside the ISO range."""
+        assert self.parser._validate_track_data("%B4111^doe?", 1) is False
+        assert self.parser._validate_track_data("%B4111\ufffd?", 1) is False
+
     def test_validate_empty_data(self):
         """Test validation of empty data."""
         assert self.parser._validate_track_data("", 1) is False
@@ -96,6 +118,46 @@ class TestTrackParser:
         assert "[OK]" in formatted
         assert "%B1234^TEST^2512?" in formatted
 
+    def test_format_track_display_error(self):
+        """Test error lines follow their track."""
+        tracks = [
+            TrackData(track_number=1, data="", raw_data=b"", is_valid=False,
+                      error_message="Read error"),
+            TrackData(track_number=2, data=";1234?", raw_data=b"", is_valid=True),
+        ]
+
+        formatted = self.parser.format_track_display(tracks)
+
+        assert formatted == "Track 1 [ERROR]: \n  Error: Read error\nTrack 2 [OK]: ;1234?"
+
+    def test_parse_aamva(self):
+        """Test parsing common AAMVA fields."""
+        result = self.parser.parse_aamva("%CADOE123^SMITH$JOHN$^")
+
+        assert result['iin'] == 'CA'
+        assert result['last_name'] == 'SMITH'
+        assert result['first_name'] == 'JOHN'
+
+    def test_parse_iso_response(self):
+        """Test extracting tracks from an ISO read response."""
+        response = b'\x1bs\x1b\x01%B1234^DOE?\x1b\x02;1234=25?\x1b\x03?\x1c\x1b0'
+        tracks = self.parser.parse_iso_response(response)
+
+        assert [t.track_number for t in tracks] == [1, 2, 3]
+        assert tracks[0].data == "%B1234^DOE?"
+        assert tracks[1].data == ";1234=25?"
+        assert tracks[2].data == ""
+        assert tracks[2].is_valid is False
+
+    def test_parse_raw_response(self):
+        """Test extracting raw track bytes as hex."""
+        response = b'\x1bs\x1b\x01\xaa\xbb\x1b\x02\xcc\x1b\x03?\x1c\x1b0'
+        tracks = self.parser.parse_raw_response(response)
+
+        assert tracks[0].data == "aabb"
+        assert tracks[1].raw_data == b'\xcc'
+        assert tracks[2].is_valid is False
+
 
 class TestTrackData:
     """Tests for TrackData dataclass."""